@@ -8,7 +8,7 @@ Provides a unified interface for accessing all system configuration.
 import os
 import yaml
 import logging
-from typing import Any, Dict, List, Optional, TypeVar, Generic, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Generic, Union, cast
 from pathlib import Path
 import json
 from functools import lru_cache
@@ -101,6 +101,8 @@ class ConfigManager:
             
         self.logger = logging.getLogger("ConfigManager")
         self._config_data: Dict[str, Any] = {}
+        # Incremented on every change, lets callers tell when derived data is stale
+        self.version = 0
         
         # Set config directory
         if config_dir is None:
@@ -133,6 +135,7 @@ class ConfigManager:
                 # Merge user config with default
                 self._merge_configs(self._config_data, user_config)
             
+            self.version += 1
             self.logger.info("Configuration loaded successfully")
         except Exception as e:
             self.logger.error(f"Error loading configuration: {str(e)}")
@@ -170,6 +173,25 @@ class ConfigManager:
         except (KeyError, TypeError):
             return default
     
+    def get_many(self, keys: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        """
+        Get several configuration values at once
+        Takes (path, default) pairs and returns a dictionary of path to value
+        """
+        config_data = self._config_data
+        values = {}
+        
+        for path, default in keys:
+            data = config_data
+            try:
+                for part in path.split('.'):
+                    data = data[part]
+            except (KeyError, TypeError):
+                data = default
+            values[path] = data
+        
+        return values
+    
     def set(self, path: str, value: Any) -> None:
         """
         Set a configuration value by path string
@@ -186,6 +208,7 @@ class ConfigManager:
         
         # Set the leaf value
         data[parts[-1]] = value
+        self.version += 1
     
     def save(self, file_path: Optional[str] = None) -> None:
         """
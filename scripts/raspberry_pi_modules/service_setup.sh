@@ -50,7 +50,7 @@ After=network.target
 [Service]
 User=pi
 WorkingDirectory=${INSTALL_DIR}
-ExecStart=${INSTALL_DIR}/venv/bin/python3 ${INSTALL_DIR}/web/server.py
+ExecStart=${INSTALL_DIR}/venv/bin/python3 -m web
 Restart=on-failure
 RestartSec=5
 StandardOutput=journal
@@ -0,0 +1,36 @@
+"""
+Run the web server: python -m web [--async-mode MODE]
+
+Eventlet has to patch the standard library before threading, logging and the other
+modules web.server uses are imported, so the async mode is read from the command
+line or MOWER_ASYNC_MODE and the process is patched before web.server is loaded.
+"""
+
+import os
+import sys
+
+
+def _async_mode() -> str:
+    """Get the async mode from --async-mode, MOWER_ASYNC_MODE or the eventlet default"""
+    args = sys.argv[1:]
+    for i, arg in enumerate(args):
+        if arg.startswith('--async-mode='):
+            return arg.split('=', 1)[1]
+        if arg == '--async-mode' and i + 1 < len(args):
+            return args[i + 1]
+    return os.environ.get('MOWER_ASYNC_MODE', 'eventlet')
+
+
+if __name__ == '__main__':
+    async_mode = _async_mode()
+    # web.server reads the mode from the environment, so both agree
+    os.environ['MOWER_ASYNC_MODE'] = async_mode
+    if async_mode == 'eventlet':
+        try:
+            import eventlet
+            eventlet.monkey_patch()
+        except ImportError:
+            pass
+    
+    from web.server import main
+    main()
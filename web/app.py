@@ -7,21 +7,49 @@ control options, and access to various mower features and settings.
 """
 
 import os
-import json
+import sys
 import logging
 import threading
-from typing import Dict, List, Optional, Any
+import queue
+import signal
+from typing import Dict, List, Optional, Any, Callable, Deque, Iterable, Set, Tuple
+from collections import deque, OrderedDict
 from datetime import datetime, timedelta
 import time
 import math
+import hashlib
+import hmac
+from array import array
+from dataclasses import dataclass, field
 from functools import wraps
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, send_from_directory, session
+from flask import Flask, Response, render_template, request, jsonify, redirect, url_for, send_from_directory, session
+from flask.json.provider import JSONProvider
 from flask_socketio import SocketIO, emit
 import jwt
 import bcrypt
+import orjson
 import secrets
 
+try:
+    from flask_sock import Sock
+    from simple_websocket import ConnectionClosed
+    FLASK_SOCK_AVAILABLE = True
+except ImportError:
+    FLASK_SOCK_AVAILABLE = False
+
+try:
+    import eventlet
+    EVENTLET_AVAILABLE = True
+except ImportError:
+    EVENTLET_AVAILABLE = False
+
+try:
+    from cachetools import LFUCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
 from ..core.config import ConfigManager
 from ..hardware.interfaces import PowerManagement, GPSPosition
 from ..perception.lawn_health import LawnHealthAnalyzer
@@ -31,6 +59,131 @@ from ..maintenance.maintenance_tracker import MaintenanceTracker
 from ..security.theft_protection import TheftProtection, TheftStatus
 from ..scheduling.weather_scheduler import WeatherBasedScheduler
 
+# Sigmoid fit of remaining runtime against battery state of charge for Li-ion packs
+RUNTIME_CURVE_K = 55.0
+RUNTIME_CURVE_N = 3.2
+
+# Status warnings shared by every status build
+RAIN_WARNINGS = ("Rain expected in next 24 hours",)
+
+
+@dataclass(slots=True)
+class StatusSnapshot:
+    """System status assembled by the web interface, sections are None when unavailable"""
+    timestamp: str
+    state: str = "idle"
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    power: Optional[Dict[str, Any]] = None
+    zone: Optional[Dict[str, Any]] = None
+    mower: Optional[Dict[str, Any]] = None
+    sensors: Optional[Dict[str, Any]] = None
+    motors: Optional[Dict[str, Any]] = None
+    position: Optional[Dict[str, Any]] = None
+    security: Optional[Dict[str, Any]] = None
+    maintenance: Optional[Dict[str, Any]] = None
+    weather: Optional[Dict[str, Any]] = None
+    growth: Optional[Dict[str, Any]] = None
+    health: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary, leaving out unavailable sections"""
+        return {name: value for name in self.__slots__ if (value := getattr(self, name)) is not None}
+
+
+class _OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj: Any, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs) -> Any:
+        return orjson.loads(s)
+
+
+class _OrjsonShim:
+    """Minimal json-module replacement backed by orjson, for Socket.IO packet encoding"""
+    
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+    
+    @staticmethod
+    def loads(data: Any, **kwargs) -> Any:
+        return orjson.loads(data)
+
+
+class _BoundedWSGIMiddleware:
+    """
+    WSGI middleware allowing at most a fixed number of requests to be handled at once
+    
+    Long-lived connections (Socket.IO and WebSocket paths) bypass the limit, otherwise
+    a few open dashboards would hold every slot. A slot is held until the response
+    body has been sent, so streamed responses are bounded as well.
+    """
+    
+    def __init__(self, wsgi_app: Callable, max_concurrent: int,
+                 bypass_prefixes: Tuple[str, ...] = (), timeout: float = 10.0):
+        self.wsgi_app = wsgi_app
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self.bypass_prefixes = bypass_prefixes
+        self.timeout = timeout
+    
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Any:
+        if environ.get("PATH_INFO", "").startswith(self.bypass_prefixes):
+            return self.wsgi_app(environ, start_response)
+        
+        if not self._slots.acquire(timeout=self.timeout):
+            start_response("503 Service Unavailable",
+                           [("Content-Type", "text/plain"), ("Retry-After", "1")])
+            return [b"Server busy"]
+        
+        try:
+            body = self.wsgi_app(environ, start_response)
+        except BaseException:
+            self._slots.release()
+            raise
+        return _ReleasingBody(body, self._slots)
+
+
+class _ReleasingBody:
+    """Response body wrapper that frees a connection slot when the server closes it"""
+    
+    def __init__(self, body: Iterable[bytes], slots: threading.BoundedSemaphore):
+        self._body = body
+        self._slots = slots
+        self._released = False
+    
+    def __iter__(self):
+        return iter(self._body)
+    
+    def close(self) -> None:
+        try:
+            close = getattr(self._body, "close", None)
+            if close is not None:
+                close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._slots.release()
+
+
+def monkey_patch(async_mode: Optional[str] = None) -> None:
+    """
+    Patch the standard library for eventlet when it is the selected async mode
+    
+    Importing this module has no side effects. Entry points that serve the web
+    interface with eventlet call this first, before the web interface, the robot
+    subsystems or any other threads are created.
+    
+    Args:
+        async_mode: Selected async mode, defaults to MOWER_ASYNC_MODE or eventlet
+    """
+    if async_mode is None:
+        async_mode = os.environ.get("MOWER_ASYNC_MODE", "eventlet")
+    if async_mode == "eventlet" and EVENTLET_AVAILABLE:
+        eventlet.monkey_patch()
+
 
 class WebInterface:
     """
@@ -80,7 +233,11 @@ class WebInterface:
         self.key_file = config.get("web.key_file", "")
         self.require_login = config.get("web.require_login", True)
         self.session_timeout = config.get("web.session_timeout", 3600)  # 1 hour
-        self.jwt_secret = config.get("web.jwt_secret", secrets.token_hex(32))
+        self.jwt_secret = config.get("web.jwt_secret") or self._generate_secret("web.jwt_secret", 32)
+        self.bcrypt_rounds = config.get("web.bcrypt_rounds", 10)
+        
+        # Battery runtime model
+        self.refresh_battery_model()
         
         # Paths
         data_dir = config.get("system.data_dir", "data")
@@ -97,31 +254,97 @@ class WebInterface:
         self.app = Flask(__name__, 
                         template_folder=template_dir,
                         static_folder=static_dir)
-        self.app.secret_key = secrets.token_hex(16)
+        self.app.json = _OrjsonProvider(self.app)
+        # Errors still reach the log when the debugger is disabled
+        self.app.config["PROPAGATE_EXCEPTIONS"] = True
+        self.app.secret_key = config.get("web.secret_key") or self._generate_secret("web.secret_key", 16)
         
         # Initialize Socket.IO for real-time updates
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        # With a message queue (e.g. redis://localhost:6379/0) emits are fanned out
+        # through the queue so several server processes can share clients
+        # Eventlet (the default) or gevent serve long-lived connections as greenlets
+        # instead of one thread each. For gevent the entrypoint must set
+        # MOWER_ASYNC_MODE=gevent and apply gevent.monkey.patch_all() before other imports.
+        self.message_queue = config.get("web.message_queue")
+        self.async_mode = config.get("web.async_mode", "eventlet" if EVENTLET_AVAILABLE else None)
+        if (self.async_mode in ("eventlet", None) and EVENTLET_AVAILABLE
+                and not eventlet.patcher.is_monkey_patched("thread")):
+            # Unpatched, the server green thread and the blocking status loop would
+            # never run on the hub. Entry points call monkey_patch() to use eventlet.
+            self.logger.warning("eventlet selected but the process is not monkey-patched "
+                                "(call web.app.monkey_patch() first), falling back to threading")
+            self.async_mode = "threading"
+        self.socketio = SocketIO(self.app,
+                                 async_mode=self.async_mode,
+                                 cors_allowed_origins="*",
+                                 message_queue=self.message_queue,
+                                 json=_OrjsonShim)
+        
+        # Plain WebSocket status channel without the Socket.IO protocol overhead
+        self.sock = Sock(self.app) if FLASK_SOCK_AVAILABLE else None
+        self._ws_clients: Set[queue.Queue] = set()
+        self._ws_clients_lock = threading.Lock()
+        self._client_count = 0  # connected Socket.IO clients
+        self._client_count_lock = threading.Lock()
+        self.ws_client_queue_size = 16
+        
+        # Bound concurrent connections so a burst of clients cannot exhaust memory
+        if self.socketio.async_mode == "threading":
+            default_connections = min(32, (os.cpu_count() or 1) * 4)
+        else:
+            default_connections = 1024
+        self.max_connections = config.get("web.max_connections", default_connections)
+        if self.socketio.async_mode == "threading":
+            # The Werkzeug server starts a thread per connection, limit how many run at once
+            self.app.wsgi_app = _BoundedWSGIMiddleware(self.app.wsgi_app, self.max_connections,
+                                                       bypass_prefixes=("/socket.io", "/ws/"))
         
         # Users and authentication
+        self.users_save_delay = 0.2  # seconds, coalesces bursts of user changes
+        self._users_lock = threading.Lock()
+        self._users_dirty = False
+        self._users_save_timer: Optional[threading.Timer] = None
+        self._login_cache_size = 256
+        self._login_cache: "OrderedDict[tuple, bool]" = OrderedDict()
+        self._login_cache_lock = threading.Lock()
+        self._login_pepper = secrets.token_bytes(32)  # per process, never persisted
         self.users = self._load_users()
+        self._admin_count = sum(1 for u in self.users.values() if u["role"] == "admin")
         if not self.users and self.require_login:
             self._create_default_admin()
         
         # Status tracking
-        self.last_status_update = 0
         self.status_update_interval = 1.0  # seconds
-        self.telemetry_history: Dict[str, List[Dict[str, Any]]] = {
-            "battery_level": [],
-            "temperature": [],
-            "motor_load": [],
-            "errors": []
-        }
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._status_cache_ttl = 1.0  # seconds
+        self._status_changed = threading.Event()
+        self.broadcast_debounce = config.get("web.broadcast_debounce_ms", 50) / 1000.0  # seconds
+        self._last_status: Dict[str, Any] = {}
+        self._health_counts: Tuple[Any, int, int] = (None, 0, 0)
+        # Weather and growth summaries, reused within the same minute until notify_status_changed()
+        self._summary_cache = LFUCache(maxsize=16) if CACHETOOLS_AVAILABLE else None
+        self._summary_cache_lock = threading.Lock()
         self.max_history_points = 100
+        # Telemetry history, stored column-wise: one timestamp array shared by one
+        # float array per metric, and (timestamp, message) tuples for errors
+        self._hist_ts = array('d')
+        self._hist_values: Dict[str, array] = {
+            "battery_level": array('f'),
+            "temperature": array('f'),
+            "motor_load": array('f')
+        }
+        self.error_history: Deque[Tuple[float, str]] = deque(maxlen=self.max_history_points)
+        
+        # Rendered page cache, keyed by template and render context
+        self.page_cache_ttl = 60.0  # seconds
+        self._page_cache: Dict[tuple, tuple] = {}
         
         # Status flags
         self.is_running = False
+        self.update_task = None
         self.server_thread = None
-        self.update_thread = None
+        self._server_kwargs: Dict[str, Any] = {}
+        self._serving = False
         
         # Register routes and socket events
         self._register_routes()
@@ -129,6 +352,28 @@ class WebInterface:
         
         self.logger.info("Web interface initialized")
     
+    def _generate_secret(self, path: str, nbytes: int) -> str:
+        """
+        Generate a secret and persist it to the configuration
+        
+        Keeping the secret across restarts means existing sessions and tokens stay valid.
+        
+        Args:
+            path: Configuration path to store the secret under
+            nbytes: Number of random bytes
+            
+        Returns:
+            Hex-encoded secret
+        """
+        secret = secrets.token_hex(nbytes)
+        try:
+            self.config.set(path, secret)
+            self.config.save()
+        except Exception as e:
+            self.logger.warning(f"Could not persist generated {path}: {e}")
+        
+        return secret
+    
     def _load_users(self) -> Dict[str, Dict[str, Any]]:
         """
         Load users from file
@@ -138,8 +383,8 @@ class WebInterface:
         """
         if os.path.exists(self.users_file):
             try:
-                with open(self.users_file, 'r') as f:
-                    users = json.load(f)
+                with open(self.users_file, 'rb') as f:
+                    users = orjson.loads(f.read())
                 
                 self.logger.info(f"Loaded {len(users)} users")
                 return users
@@ -148,11 +393,44 @@ class WebInterface:
         
         return {}
     
-    def _save_users(self) -> None:
-        """Save users to file"""
+    def _save_users(self, immediate: bool = False) -> None:
+        """
+        Mark user data as changed and schedule a write to file
+        
+        Consecutive changes within the save delay are coalesced into one write.
+        
+        Args:
+            immediate: Write the file now instead of scheduling it
+        """
+        with self._users_lock:
+            self._users_dirty = True
+            if not immediate and self._users_save_timer is None:
+                self._users_save_timer = threading.Timer(self.users_save_delay, self._flush_users)
+                self._users_save_timer.daemon = True
+                self._users_save_timer.start()
+        
+        if immediate:
+            self._flush_users()
+    
+    def _flush_users(self) -> None:
+        """Write user data to file if it has changed"""
+        with self._users_lock:
+            if self._users_save_timer is not None:
+                self._users_save_timer.cancel()
+                self._users_save_timer = None
+            if not self._users_dirty:
+                return
+            self._users_dirty = False
+            data = orjson.dumps(self.users)
+        
+        # Write to a temporary file and rename it so the file is never left half-written
+        tmp_file = self.users_file + ".tmp"
         try:
-            with open(self.users_file, 'w') as f:
-                json.dump(self.users, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.users_file)
             
             self.logger.debug("Saved user data")
         except Exception as e:
@@ -161,7 +439,7 @@ class WebInterface:
     def _create_default_admin(self) -> None:
         """Create a default admin user"""
         default_password = "admin123"  # This is just an initial password that should be changed
-        hashed_password = bcrypt.hashpw(default_password.encode('utf-8'), bcrypt.gensalt())
+        hashed_password = bcrypt.hashpw(default_password.encode('utf-8'), bcrypt.gensalt(rounds=self.bcrypt_rounds))
         
         self.users = {
             "admin": {
@@ -171,10 +449,46 @@ class WebInterface:
                 "created_at": datetime.now().isoformat()
             }
         }
+        self._admin_count = 1
         
-        self._save_users()
+        self._save_users(immediate=True)
         self.logger.warning("Created default admin user. Please change the password!")
     
+    def _check_password(self, username: str, password: str) -> bool:
+        """
+        Check a user's password, reusing the result of identical recent attempts
+        
+        Results are cached by a keyed fingerprint of the password, so repeated logins
+        from reconnecting clients skip bcrypt. The stored hash is part of the key,
+        which makes cached results stale as soon as the password changes.
+        
+        Args:
+            username: Name of an existing user
+            password: Submitted password
+            
+        Returns:
+            True if the password matches
+        """
+        stored_hash = self.users[username]['password_hash']
+        password_bytes = password.encode('utf-8')
+        fingerprint = hmac.new(self._login_pepper, password_bytes, hashlib.sha256).digest()
+        key = (username, stored_hash, fingerprint)
+        
+        with self._login_cache_lock:
+            cached = self._login_cache.get(key)
+            if cached is not None:
+                self._login_cache.move_to_end(key)
+                return cached
+        
+        result = bcrypt.checkpw(password_bytes, stored_hash.encode('utf-8'))
+        
+        with self._login_cache_lock:
+            self._login_cache[key] = result
+            if len(self._login_cache) > self._login_cache_size:
+                self._login_cache.popitem(last=False)
+        
+        return result
+    
     def _register_routes(self) -> None:
         """Register Flask routes"""
         app = self.app
@@ -210,9 +524,9 @@ class WebInterface:
         @app.route('/')
         @login_required
         def index():
-            return render_template('index.html', 
-                                  user=session.get('user_id'),
-                                  page='dashboard')
+            return self._render_cached('index.html',
+                                       user=session.get('user_id'),
+                                       page='dashboard')
         
         @app.route('/login', methods=['GET', 'POST'])
         def login():
@@ -223,8 +537,7 @@ class WebInterface:
                 password = request.form['password']
                 
                 if username in self.users:
-                    stored_hash = self.users[username]['password_hash'].encode('utf-8')
-                    if bcrypt.checkpw(password.encode('utf-8'), stored_hash):
+                    if self._check_password(username, password):
                         session['user_id'] = username
                         session['role'] = self.users[username]['role']
                         
@@ -254,8 +567,7 @@ class WebInterface:
                 return jsonify({"error": "Missing username or password"}), 400
             
             if username in self.users:
-                stored_hash = self.users[username]['password_hash'].encode('utf-8')
-                if bcrypt.checkpw(password.encode('utf-8'), stored_hash):
+                if self._check_password(username, password):
                     # Generate token
                     expiration = datetime.utcnow() + timedelta(seconds=self.session_timeout)
                     payload = {
@@ -280,30 +592,30 @@ class WebInterface:
         @app.route('/dashboard')
         @login_required
         def dashboard():
-            return render_template('dashboard.html',
-                                 user=session.get('user_id'),
-                                 page='dashboard')
+            return self._render_cached('dashboard.html',
+                                       user=session.get('user_id'),
+                                       page='dashboard')
         
         @app.route('/zones')
         @login_required
         def zones():
-            return render_template('zones.html',
-                                 user=session.get('user_id'),
-                                 page='zones')
+            return self._render_cached('zones.html',
+                                       user=session.get('user_id'),
+                                       page='zones')
         
         @app.route('/schedule')
         @login_required
         def schedule():
-            return render_template('schedule.html',
-                                 user=session.get('user_id'),
-                                 page='schedule')
+            return self._render_cached('schedule.html',
+                                       user=session.get('user_id'),
+                                       page='schedule')
         
         @app.route('/maintenance')
         @login_required
         def maintenance():
-            return render_template('maintenance.html',
-                                 user=session.get('user_id'),
-                                 page='maintenance')
+            return self._render_cached('maintenance.html',
+                                       user=session.get('user_id'),
+                                       page='maintenance')
         
         @app.route('/settings')
         @login_required
@@ -312,9 +624,9 @@ class WebInterface:
             if session.get('role') != 'admin':
                 return redirect(url_for('index'))
             
-            return render_template('settings.html',
-                                 user=session.get('user_id'),
-                                 page='settings')
+            return self._render_cached('settings.html',
+                                       user=session.get('user_id'),
+                                       page='settings')
         
         @app.route('/api/status')
         @login_required
@@ -454,13 +766,15 @@ class WebInterface:
                 return jsonify({"error": "Invalid role"}), 400
             
             # Create new user
-            hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+            hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self.bcrypt_rounds))
             self.users[username] = {
                 "password_hash": hashed_password.decode('utf-8'),
                 "role": role,
                 "name": name,
                 "created_at": datetime.now().isoformat()
             }
+            if role == 'admin':
+                self._admin_count += 1
             
             self._save_users()
             self.logger.info(f"Created new user: {username}")
@@ -483,10 +797,13 @@ class WebInterface:
                 return jsonify({"error": "User not found"}), 404
             
             # Prevent deleting the last admin user
-            if self.users[username]["role"] == "admin" and len([u for u in self.users.values() if u["role"] == "admin"]) <= 1:
+            is_admin = self.users[username]["role"] == "admin"
+            if is_admin and self._admin_count <= 1:
                 return jsonify({"error": "Cannot delete the last admin user"}), 409
             
             # Delete user
+            if is_admin:
+                self._admin_count -= 1
             del self.users[username]
             self._save_users()
             self.logger.info(f"Deleted user: {username}")
@@ -512,39 +829,149 @@ class WebInterface:
                 return jsonify({"error": "User not found"}), 404
             
             # Change password
-            hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+            hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self.bcrypt_rounds))
             self.users[username]["password_hash"] = hashed_password.decode('utf-8')
             self._save_users()
             self.logger.info(f"Changed password for: {username}")
             
             return jsonify({"success": True})
     
+    def _render_cached(self, template_name: str, **context) -> Response:
+        """
+        Render a page template, reusing the rendered HTML for repeated requests
+        
+        The response carries an ETag so browsers get a 304 when the page is unchanged.
+        
+        Args:
+            template_name: Template to render
+            **context: Template variables
+            
+        Returns:
+            HTML response
+        """
+        key = (template_name, tuple(sorted(context.items())))
+        now = time.monotonic()
+        
+        entry = self._page_cache.get(key)
+        if entry is None or now - entry[0] > self.page_cache_ttl:
+            body = render_template(template_name, **context).encode('utf-8')
+            etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+            entry = (now, body, etag)
+            self._page_cache[key] = entry
+        
+        _, body, etag = entry
+        response = Response(body, mimetype='text/html')
+        response.set_etag(etag)
+        return response.make_conditional(request)
+    
+    def _verify_socket_token(self, token: Optional[str]) -> bool:
+        """
+        Check the JWT a socket client connects with
+        
+        Args:
+            token: Token from the connection query string
+            
+        Returns:
+            True if the client may connect
+        """
+        if not self.require_login:
+            return True
+        if not token:
+            return False
+        
+        try:
+            jwt.decode(token, self.jwt_secret, algorithms=['HS256'])
+            return True
+        except jwt.PyJWTError:
+            return False
+    
+    def _broadcast_ws(self, event: str, data: Dict[str, Any]) -> None:
+        """
+        Send a message to all plain WebSocket status clients
+        
+        The message is serialized once for all clients. Clients that fall too far
+        behind are dropped and get a full status again when they reconnect.
+        
+        Args:
+            event: Message type
+            data: Message payload
+        """
+        with self._ws_clients_lock:
+            if not self._ws_clients:
+                return
+            message = orjson.dumps({"type": event, "data": data}).decode('utf-8')
+            for updates in list(self._ws_clients):
+                try:
+                    updates.put_nowait(message)
+                except queue.Full:
+                    self._ws_clients.discard(updates)
+    
+    def _full_status_message(self) -> str:
+        """
+        Build the full status message for a plain WebSocket client
+        
+        Only the dynamic status is serialized, the static fields come from the
+        precompiled prefix.
+        
+        Returns:
+            JSON message text
+        """
+        dynamic = orjson.dumps(self._get_system_status())
+        return (self._static_status_prefix + b',' + dynamic[1:] + b'}').decode('utf-8')
+    
     def _register_socket_events(self) -> None:
-        """Register Socket.IO event handlers"""
+        """Register Socket.IO and plain WebSocket event handlers"""
+        
+        if self.sock:
+            @self.sock.route('/ws/status')
+            def ws_status(ws):
+                if not self._verify_socket_token(request.args.get('token')):
+                    ws.close(reason=1008, message="Unauthorized")
+                    return
+                
+                updates: queue.Queue = queue.Queue(maxsize=self.ws_client_queue_size)
+                with self._ws_clients_lock:
+                    self._ws_clients.add(updates)
+                
+                try:
+                    ws.send(self._full_status_message())
+                    while ws.connected:
+                        try:
+                            ws.send(updates.get(timeout=30.0))
+                        except queue.Empty:
+                            pass
+                        
+                        with self._ws_clients_lock:
+                            if updates not in self._ws_clients:
+                                break
+                except ConnectionClosed:
+                    pass
+                finally:
+                    with self._ws_clients_lock:
+                        self._ws_clients.discard(updates)
         
         @self.socketio.on('connect')
         def handle_connect():
             # Authenticate socket connections
-            auth = request.args.get('token')
-            if self.require_login and not auth:
+            if not self._verify_socket_token(request.args.get('token')):
                 return False
             
-            if self.require_login:
-                try:
-                    jwt.decode(auth, self.jwt_secret, algorithms=['HS256'])
-                except jwt.PyJWTError:
-                    return False
+            with self._client_count_lock:
+                self._client_count += 1
             
             self.logger.debug("Client connected to socket")
-            emit('status', self._get_system_status())
+            emit('status', {**self._static_status, **self._get_system_status()})
         
         @self.socketio.on('disconnect')
         def handle_disconnect():
+            with self._client_count_lock:
+                self._client_count = max(0, self._client_count - 1)
+            
             self.logger.debug("Client disconnected from socket")
         
         @self.socketio.on('get_status')
         def handle_get_status():
-            emit('status', self._get_system_status())
+            emit('status', {**self._static_status, **self._get_system_status()})
         
         @self.socketio.on('start_mower')
         def handle_start_mower(data):
@@ -566,6 +993,27 @@ class WebInterface:
                 "success": True
             })
         
+        # Single command event used by the dashboard, same format as in web/server.py
+        command_handlers = {
+            "start": handle_start_mower,
+            "stop": lambda data: handle_stop_mower()
+        }
+        
+        @self.socketio.on('mower_command')
+        def handle_mower_command(data=None):
+            if data is None:
+                data = {}
+            if not isinstance(data, dict):
+                emit('command_result', {"command": None, "success": False, "error": "Invalid command data"})
+                return
+            
+            command = data.get('command')
+            handler = command_handlers.get(command)
+            if handler is None:
+                emit('command_result', {"command": command, "success": False, "error": "Unknown command"})
+                return
+            handler(data)
+        
         @self.socketio.on('control_manual')
         def handle_control_manual(data):
             # Manual control commands
@@ -581,26 +1029,99 @@ class WebInterface:
                 "success": True
             })
     
+    def notify_status_changed(self) -> None:
+        """
+        Signal that subsystem data has changed
+        
+        Producers such as the weather, growth and health modules call this after
+        committing new data so clients receive it without waiting for the next update.
+        """
+        # Cached summaries predate the change
+        if self._summary_cache is not None:
+            with self._summary_cache_lock:
+                self._summary_cache.clear()
+        self._status_changed.set()
+    
     def _status_update_loop(self) -> None:
-        """Background thread for status updates"""
+        """Background task for status updates"""
+        interval_ns = int(self.status_update_interval * 1e9)
+        next_deadline_ns = time.monotonic_ns() + interval_ns
         while self.is_running:
-            current_time = time.time()
+            # Wake on a change notification, or at the next interval boundary for data
+            # that is only available by polling (battery, position). Deadlines advance
+            # on a fixed grid so slow builds don't make the cadence drift.
+            timeout = max(0, next_deadline_ns - time.monotonic_ns()) / 1e9
+            if self._status_changed.wait(timeout=timeout):
+                if self.broadcast_debounce > 0:
+                    # Let notifications from other producers in the same burst arrive first
+                    self.socketio.sleep(self.broadcast_debounce)
+            else:
+                now_ns = time.monotonic_ns()
+                next_deadline_ns += interval_ns
+                if next_deadline_ns <= now_ns:
+                    # Fell behind by more than an interval, skip the missed ticks
+                    next_deadline_ns = now_ns + interval_ns
+            self._status_changed.clear()
+            if not self.is_running:
+                break
             
-            # Update status at regular intervals
-            if current_time - self.last_status_update >= self.status_update_interval:
-                try:
-                    status = self._get_system_status()
-                    self.socketio.emit('status', status)
-                    
-                    # Update telemetry history
-                    self._update_telemetry_history(status)
-                    
-                    self.last_status_update = current_time
-                except Exception as e:
-                    self.logger.error(f"Error updating status: {e}")
+            if self._client_count == 0 and not self._ws_clients and not self.message_queue:
+                # Nobody is listening, skip the build. The next broadcast is then
+                # a full delta so clients that connect in between stay consistent.
+                # With a message queue, clients may be connected to other processes.
+                self._last_status = {}
+                continue
+            
+            try:
+                status = self._refresh_status()
+                
+                # Clients receive the full status on connect, after that only what changed
+                delta = self._status_delta(self._last_status, status)
+                self._last_status = status
+                if delta:
+                    self.socketio.emit('status_delta', delta)
+                    self._broadcast_ws('status_delta', delta)
+                
+                # Update telemetry history
+                self._update_telemetry_history(status)
+            except Exception as e:
+                self.logger.error(f"Error updating status: {e}")
+    
+    @staticmethod
+    def _status_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compute the changes between two status snapshots
+        
+        Changed sections are sent whole, clients replace them as they are. Keys that
+        disappeared are sent as None. The timestamp is only included when something
+        else changed.
+        
+        Args:
+            old: Previously broadcast status
+            new: Current status
+            
+        Returns:
+            Dictionary of changed keys, empty if nothing changed
+        """
+        delta: Dict[str, Any] = {}
+        
+        for key, value in new.items():
+            if key == "timestamp":
+                continue
+            
+            old_value = old.get(key)
+            if value == old_value:
+                continue
             
-            # Sleep a bit
-            time.sleep(0.5)
+            delta[key] = value
+        
+        for key in old.keys() - new.keys():
+            delta[key] = None
+        
+        if delta:
+            delta["timestamp"] = new.get("timestamp")
+        
+        return delta
     
     def _update_telemetry_history(self, status: Dict[str, Any]) -> None:
         """
@@ -609,79 +1130,142 @@ class WebInterface:
         Args:
             status: Status data
         """
-        timestamp = datetime.now().isoformat()
-        
-        # Update battery level history
-        if 'power' in status and 'battery_level' in status['power']:
-            self.telemetry_history['battery_level'].append({
-                'timestamp': timestamp,
-                'value': status['power']['battery_level']
-            })
-        
-        # Update temperature history
-        if 'sensors' in status and 'temperature' in status['sensors']:
-            self.telemetry_history['temperature'].append({
-                'timestamp': timestamp,
-                'value': status['sensors']['temperature']
-            })
+        timestamp = time.time()
+        
+        # Numeric metrics share one timestamp column, missing readings are stored as NaN
+        power = status.get('power') or {}
+        sensors = status.get('sensors') or {}
+        motors = status.get('motors') or {}
+        # All readings are converted before anything is appended, so a bad value
+        # cannot leave the columns with different lengths
+        readings = (
+            ('battery_level', self._to_float(power.get('battery_level'))),
+            ('temperature', self._to_float(sensors.get('temperature'))),
+            ('motor_load', self._to_float(motors.get('load')))
+        )
+        values = self._hist_values
+        self._hist_ts.append(timestamp)
+        for name, reading in readings:
+            values[name].append(reading)
         
-        # Update motor load history
-        if 'motors' in status and 'load' in status['motors']:
-            self.telemetry_history['motor_load'].append({
-                'timestamp': timestamp,
-                'value': status['motors']['load']
-            })
+        # Limit history size
+        excess = len(self._hist_ts) - self.max_history_points
+        if excess > 0:
+            del self._hist_ts[:excess]
+            for column in values.values():
+                del column[:excess]
         
         # Update error history
-        if 'errors' in status and status['errors']:
-            for error in status['errors']:
-                self.telemetry_history['errors'].append({
-                    'timestamp': timestamp,
-                    'value': error
-                })
+        errors = status.get('errors')
+        if errors:
+            self.error_history.extend((timestamp, error) for error in errors)
+    
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        """
+        Convert a telemetry reading to a float
         
-        # Limit history size
-        for key in self.telemetry_history:
-            if len(self.telemetry_history[key]) > self.max_history_points:
-                self.telemetry_history[key] = self.telemetry_history[key][-self.max_history_points:]
+        Args:
+            value: Reading, possibly None or not numeric
+            
+        Returns:
+            The reading as a float, NaN if it is missing or not numeric
+        """
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return math.nan
+    
+    def get_telemetry_history(self) -> Dict[str, Any]:
+        """
+        Get the recorded telemetry history
+        
+        Returns:
+            Dictionary with the sample timestamps, one list of values per metric
+            (None where a reading was missing) and the (timestamp, message) errors
+        """
+        history: Dict[str, Any] = {"timestamps": self._hist_ts.tolist()}
+        for name, column in self._hist_values.items():
+            history[name] = [None if math.isnan(v) else v for v in column]
+        history["errors"] = list(self.error_history)
+        return history
     
     def _get_system_status(self) -> Dict[str, Any]:
         """
         Get current system status
         
+        Rapid requests within the status cache TTL share one snapshot instead of
+        querying every subsystem again.
+        
         Returns:
             Status dictionary
         """
-        status = {
-            "timestamp": datetime.now().isoformat(),
-            "state": "idle",  # Default state
-            "errors": [],
-            "warnings": []
-        }
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < self._status_cache_ttl:
+            return dict(cached[1])
+        
+        return dict(self._refresh_status())
+    
+    def _refresh_status(self) -> Dict[str, Any]:
+        """
+        Build a fresh status snapshot and store it in the status cache
+        
+        Returns:
+            Status dictionary
+        """
+        status = self._build_status()
+        self._status_cache = (time.monotonic(), status)
+        return status
+    
+    def _build_status(self) -> Dict[str, Any]:
+        """
+        Build the system status from all subsystems
+        
+        Returns:
+            Status dictionary
+        """
+        status = StatusSnapshot(timestamp=datetime.now().isoformat())
+        
+        pm = self.power_manager
+        zm = self.zone_manager
+        tp = self.theft_protection
+        mt = self.maintenance_tracker
+        ws = self.weather_scheduler
+        gp = self.growth_predictor
+        
+        # Summaries may involve disk or network access, so fetch them concurrently
+        summary_calls = {}
+        if mt:
+            summary_calls["maintenance"] = mt.get_maintenance_summary
+        if ws:
+            summary_calls["weather"] = lambda: self._cached_summary("weather", ws.get_weather_summary)
+        if gp:
+            summary_calls["growth"] = lambda: self._cached_summary("growth", gp.get_growth_summary)
+        summaries = self._fetch_concurrently(summary_calls)
         
         # Add power status
-        if self.power_manager:
-            battery_level = self.power_manager.get_battery_percentage()
-            charging = self.power_manager.is_charging()
+        if pm:
+            battery_level = pm.get_battery_percentage()
+            charging = pm.is_charging()
             
-            status["power"] = {
+            status.power = {
                 "battery_level": battery_level,
                 "charging": charging,
                 "estimated_runtime": self._estimate_runtime(battery_level)
             }
         
         # Add zone status
-        if self.zone_manager:
-            current_zone = self.zone_manager.get_current_zone()
-            status["zone"] = {
+        if zm:
+            current_zone = zm.get_current_zone()
+            status.zone = {
                 "current_zone": current_zone.name if current_zone else None,
-                "current_zone_id": self.zone_manager.current_zone_id,
-                "zone_count": len(self.zone_manager.get_all_zones())
+                "current_zone_id": zm.current_zone_id,
+                "zone_count": len(zm.get_all_zones())
             }
         
         # Add mower status (in a real system, this would be retrieved from the mower controller)
         # This is a mock implementation
-        status["mower"] = {
+        status.mower = {
             "state": "idle",  # idle, mowing, docking, error
             "blade_on": False,
             "movement": "stopped",  # stopped, moving, turning
@@ -691,7 +1275,7 @@ class WebInterface:
         }
         
         # Add sensor data (mocked)
-        status["sensors"] = {
+        status.sensors = {
             "temperature": 25.0,  # C
             "humidity": 45.0,  # %
             "light_level": 80.0,  # %
@@ -699,38 +1283,37 @@ class WebInterface:
         }
         
         # Add motor status (mocked)
-        status["motors"] = {
+        status.motors = {
             "left_speed": 0.0,
             "right_speed": 0.0,
             "blade_speed": 0.0,
             "load": 0.0
         }
         
-        # Add position status
-        if self.theft_protection:
-            position = self.theft_protection.current_position
+        # Add position and security status
+        if tp:
+            position = tp.current_position
             if position:
-                status["position"] = {
+                status.position = {
                     "latitude": position.latitude,
                     "longitude": position.longitude,
                     "accuracy": position.accuracy,
                     "timestamp": datetime.fromtimestamp(position.timestamp).isoformat()
                 }
-        
-        # Add security status
-        if self.theft_protection:
-            status["security"] = {
-                "status": self.theft_protection.current_status.value,
-                "alarm_active": self.theft_protection.alarm_active,
-                "within_geofence": self.theft_protection._is_within_geofence(),
-                "last_update": datetime.fromtimestamp(self.theft_protection.last_update_time).isoformat() 
-                               if self.theft_protection.last_update_time > 0 else None
+            
+            last_update_time = tp.last_update_time
+            status.security = {
+                "status": tp.current_status.value,
+                "alarm_active": tp.alarm_active,
+                "within_geofence": tp._is_within_geofence(),
+                "last_update": datetime.fromtimestamp(last_update_time).isoformat() 
+                               if last_update_time > 0 else None
             }
         
         # Add maintenance status
-        if self.maintenance_tracker:
-            maintenance_summary = self.maintenance_tracker.get_maintenance_summary()
-            status["maintenance"] = {
+        maintenance_summary = summaries.get("maintenance")
+        if maintenance_summary is not None:
+            status.maintenance = {
                 "overdue_count": maintenance_summary.get("overdue_count", 0),
                 "due_soon_count": maintenance_summary.get("due_soon_count", 0),
                 "has_critical": maintenance_summary.get("has_critical_maintenance", False),
@@ -740,42 +1323,141 @@ class WebInterface:
             
             # Add maintenance warnings
             if maintenance_summary.get("has_critical_maintenance", False):
-                status["warnings"].append("Maintenance overdue")
+                status.warnings.append("Maintenance overdue")
         
         # Add weather status
-        if self.weather_scheduler:
-            weather_summary = self.weather_scheduler.get_weather_summary()
+        weather_summary = summaries.get("weather")
+        if weather_summary is not None:
             if weather_summary.get("available", False):
-                status["weather"] = {
+                rain_expected = weather_summary.get("rain_expected_24h", False)
+                status.weather = {
                     "condition": weather_summary.get("current_condition"),
                     "temperature": weather_summary.get("current_temperature"),
                     "description": weather_summary.get("current_description"),
-                    "rain_expected_24h": weather_summary.get("rain_expected_24h", False)
+                    "rain_expected_24h": rain_expected
                 }
                 
                 # Add weather warnings
-                if weather_summary.get("rain_expected_24h", False):
-                    status["warnings"].append("Rain expected in next 24 hours")
+                status.warnings.extend(RAIN_WARNINGS if rain_expected else ())
         
         # Add growth status
-        if self.growth_predictor:
-            growth_summary = self.growth_predictor.get_growth_summary()
+        growth_summary = summaries.get("growth")
+        if growth_summary is not None:
             if growth_summary.get("available", False):
-                status["growth"] = {
+                status.growth = {
                     "average_rate": growth_summary.get("average_growth_rate"),
                     "days_until_mowing": growth_summary.get("days_until_mowing"),
                     "next_mowing_date": growth_summary.get("next_mowing_date")
                 }
         
         # Add health status
-        if self.health_analyzer and self.health_analyzer.last_report:
-            status["health"] = {
-                "status": self.health_analyzer.last_report.health_status.value,
-                "issues_count": len(self.health_analyzer.last_report.issues),
-                "recommendations_count": len(self.health_analyzer.last_report.recommendations)
+        ha = self.health_analyzer
+        report = ha.last_report if ha else None
+        if report:
+            # Only recount when a new report has been produced
+            cached_report, issues_count, recommendations_count = self._health_counts
+            if cached_report is not report:
+                issues_count = len(report.issues)
+                recommendations_count = len(report.recommendations)
+                self._health_counts = (report, issues_count, recommendations_count)
+            
+            status.health = {
+                "status": report.health_status.value,
+                "issues_count": issues_count,
+                "recommendations_count": recommendations_count
             }
         
-        return status
+        return status.to_dict()
+    
+    def _cached_summary(self, source: str, func: Callable[[], Any]) -> Any:
+        """
+        Get a subsystem summary, reusing it for the rest of the current minute
+        
+        Args:
+            source: Summary name, used as the cache key with the minute bucket
+            func: Zero-argument callable that produces the summary
+            
+        Returns:
+            Summary returned by func
+        """
+        if self._summary_cache is None:
+            return func()
+        
+        key = (source, int(time.monotonic() // 60))
+        with self._summary_cache_lock:
+            summary = self._summary_cache.get(key)
+        if summary is not None:
+            return summary
+        
+        summary = func()
+        if summary is not None:
+            with self._summary_cache_lock:
+                self._summary_cache[key] = summary
+        return summary
+    
+    def _fetch_concurrently(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Run independent subsystem queries concurrently
+        
+        Each call runs as a Socket.IO background task, so it is a greenlet under
+        eventlet/gevent and a thread otherwise.
+        
+        Args:
+            calls: Dictionary of result key to zero-argument callable
+            
+        Returns:
+            Dictionary of result key to result, None for calls that failed
+        """
+        results: Dict[str, Any] = {}
+        
+        def run(key: str, func: Callable[[], Any]) -> None:
+            try:
+                results[key] = func()
+            except Exception as e:
+                self.logger.error(f"Error getting {key} summary: {e}")
+                results[key] = None
+        
+        if len(calls) <= 1:
+            for key, func in calls.items():
+                run(key, func)
+            return results
+        
+        tasks = [self.socketio.start_background_task(run, key, func) for key, func in calls.items()]
+        for task in tasks:
+            task.join()
+        
+        return results
+    
+    def refresh_battery_model(self) -> None:
+        """Re-read the battery settings, call after changing them in the configuration"""
+        self._max_runtime_hours = float(self.config.get("hardware.battery.max_runtime_hours", 4.0))
+        self._runtime_lut = self._build_runtime_lut(self._max_runtime_hours)
+        
+        # Config-derived status fields are left out of the periodic build and only
+        # sent with full status messages. The plain WebSocket message prefix is
+        # serialized here once, without its closing braces.
+        self._static_status = {"max_runtime_hours": self._max_runtime_hours}
+        self._static_status_prefix = orjson.dumps({"type": "status", "data": self._static_status})[:-2]
+    
+    @staticmethod
+    def _build_runtime_lut(max_runtime: float) -> array:
+        """
+        Precompute the remaining runtime for every integer battery level
+        
+        Uses a sigmoidal Li-ion discharge curve, normalized so a full battery gives
+        max_runtime: runtime = max_runtime * (1 - 1 / (1 + (soc / k) ** n))
+        
+        Args:
+            max_runtime: Runtime in hours at 100% battery
+            
+        Returns:
+            Array of 101 runtimes in hours, indexed by battery level
+        """
+        def curve(soc: float) -> float:
+            return 1.0 - 1.0 / (1.0 + (soc / RUNTIME_CURVE_K) ** RUNTIME_CURVE_N)
+        
+        scale = max_runtime / curve(100.0)
+        return array('f', [curve(soc) * scale for soc in range(101)])
     
     def _estimate_runtime(self, battery_level: float) -> float:
         """
@@ -787,23 +1469,52 @@ class WebInterface:
         Returns:
             Estimated runtime in hours
         """
-        # This is a simple estimation model
-        # In a real system, this would take into account current power consumption, mowing conditions, etc.
+        # In a real system, this would also take into account current power consumption, mowing conditions, etc.
         if battery_level <= 0:
             return 0
+        if battery_level >= 100:
+            return self._runtime_lut[100]
+        
+        # Interpolate between the neighbouring table entries
+        i = int(battery_level)
+        f = battery_level - i
+        lut = self._runtime_lut
+        return lut[i] * (1.0 - f) + lut[i + 1] * f
+    
+    def _pin_to_core(self) -> None:
+        """
+        Pin the process to the CPU core given by MOWER_CORE, if set
+        
+        The server and status tasks share one interpreter, so keeping them on one
+        core avoids GIL hand-offs between cores. Scale out with more processes
+        instead. Pinning is skipped on free-threaded Python builds and when
+        MOWER_NO_PIN is set.
+        """
+        core = os.environ.get("MOWER_CORE")
+        if core is None or os.environ.get("MOWER_NO_PIN"):
+            return
         
-        # Maximum runtime when battery is at 100%
-        max_runtime = self.config.get("hardware.battery.max_runtime_hours", 4.0)
+        if not hasattr(os, "sched_setaffinity"):
+            self.logger.warning("CPU pinning not supported on this platform")
+            return
         
-        # Calculate estimated runtime (simple linear model)
-        # In a real system, this would be a non-linear curve based on discharge characteristics
-        estimated_runtime = (battery_level / 100.0) * max_runtime
+        gil_check = getattr(sys, "_is_gil_enabled", None)
+        if gil_check is not None and not gil_check():
+            self.logger.info("Free-threaded Python build, not pinning to a single core")
+            return
         
-        return estimated_runtime
+        try:
+            os.sched_setaffinity(0, {int(core)})
+            self.logger.info(f"Web interface pinned to CPU core {core}")
+        except (ValueError, OSError) as e:
+            self.logger.warning(f"Could not pin to CPU core {core}: {e}")
     
     def start(self) -> bool:
         """
-        Start the web interface server
+        Start the web interface server in the background
+        
+        Entrypoints that can give the web interface the main thread should call
+        serve_forever() instead.
         
         Returns:
             Success or failure
@@ -812,51 +1523,129 @@ class WebInterface:
             self.logger.warning("Web interface already running")
             return True
         
+        self._prepare()
+        
+        # The server runs as a background task so it lives on the eventlet hub rather than
+        # in a separate OS thread. Under eventlet the green thread is kept so stop() can kill it.
+        if self.socketio.async_mode == "eventlet":
+            self.server_thread = eventlet.spawn(self.socketio.run, self.app, **self._server_kwargs)
+        else:
+            self.server_thread = self.socketio.start_background_task(self.socketio.run, self.app, **self._server_kwargs)
+        
+        self.logger.info(f"Web interface started on {'https' if self.enable_https else 'http'}://{self.host}:{self.port}")
+        return True
+    
+    def _prepare(self) -> None:
+        """Start the web interface background tasks and prepare the server options"""
         self.is_running = True
         
-        # Start update thread
-        self.update_thread = threading.Thread(target=self._status_update_loop, daemon=True)
-        self.update_thread.start()
+        self._pin_to_core()
         
-        # Start server thread
+        # Start status updates as a Socket.IO background task so it cooperates with the server
+        self.update_task = self.socketio.start_background_task(self._status_update_loop)
+        
+        if self.socketio.async_mode == "threading":
+            self.logger.warning("No async server available, falling back to the Werkzeug development server")
+        
+        # The Werkzeug debugger is only enabled in development environments
+        debug = self.debug and os.environ.get("MOWER_ENV") == "dev"
+        if self.debug and not debug:
+            self.logger.warning("web.debug is set but MOWER_ENV is not 'dev', running without the debugger")
+        
+        # Server options
+        server_kwargs = {
+            "host": self.host,
+            "port": self.port,
+            "debug": debug,
+            "use_reloader": False
+        }
         if self.enable_https and self.cert_file and self.key_file:
-            # HTTPS
-            context = (self.cert_file, self.key_file)
-            server_kwargs = {
-                "host": self.host,
-                "port": self.port,
-                "ssl_context": context,
-                "debug": self.debug,
-                "use_reloader": False
-            }
-        else:
-            # HTTP
-            server_kwargs = {
-                "host": self.host,
-                "port": self.port,
-                "debug": self.debug,
-                "use_reloader": False
-            }
+            if self.socketio.async_mode == "threading":
+                server_kwargs["ssl_context"] = (self.cert_file, self.key_file)
+            else:
+                # gevent and eventlet servers take the certificate files directly
+                server_kwargs["certfile"] = self.cert_file
+                server_kwargs["keyfile"] = self.key_file
+        
+        # Limit the async server's connection pool
+        if self.socketio.async_mode == "eventlet":
+            server_kwargs["max_size"] = self.max_connections
+        elif self.socketio.async_mode == "gevent":
+            server_kwargs["spawn"] = self.max_connections
+        
+        self._server_kwargs = server_kwargs
+    
+    def serve_forever(self) -> None:
+        """
+        Run the web server on the calling thread until it is stopped
         
-        # Use socketio instead of standard Flask for better real-time capabilities
-        self.server_thread = threading.Thread(
-            target=self.socketio.run,
-            args=(self.app,),
-            kwargs=server_kwargs,
-            daemon=True
-        )
-        self.server_thread.start()
+        Call this from the main thread: the eventlet hub then owns it and SIGINT/SIGTERM
+        shut the server down cleanly through stop().
+        """
+        if self.is_running:
+            self.logger.warning("Web interface already running")
+            return
         
-        self.logger.info(f"Web interface started on {'https' if self.enable_https else 'http'}://{self.host}:{self.port}")
-        return True
+        self._prepare()
+        
+        def handle_signal(signum, frame):
+            self.logger.info(f"Received signal {signum}, shutting down web interface")
+            raise SystemExit(0)
+        
+        previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                previous_handlers[signum] = signal.signal(signum, handle_signal)
+        
+        self.logger.info(f"Web interface serving on {'https' if self.enable_https else 'http'}://{self.host}:{self.port}")
+        self._serving = True
+        try:
+            # Use socketio instead of standard Flask for better real-time capabilities
+            self.socketio.run(self.app, **self._server_kwargs)
+        except SystemExit:
+            pass
+        finally:
+            self._serving = False
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            self.stop()
     
     def stop(self) -> None:
         """Stop the web interface server"""
         self.is_running = False
         
-        # Stop threads
-        if self.update_thread:
-            self.update_thread.join(timeout=2.0)
+        # Stop status updates, waking the task so it exits immediately
+        self._status_changed.set()
+        if self.update_task:
+            self.update_task.join()
+            self.update_task = None
+        
+        # Write any pending user changes
+        self._flush_users()
+        
+        # Stop a server started by start()
+        if self.server_thread:
+            mode = self.socketio.async_mode
+            try:
+                if mode == "eventlet":
+                    # Unwinds eventlet.wsgi.server, which closes the listening socket
+                    self.server_thread.kill()
+                elif mode == "gevent":
+                    self.socketio.stop()
+                    self.server_thread.join()
+                else:
+                    # Werkzeug can only be shut down from inside a request
+                    self.logger.warning("Development server cannot be stopped, it exits with the process")
+            except Exception as e:
+                self.logger.error(f"Error stopping web server: {e}")
+            self.server_thread = None
+        
+        # A gevent server run by serve_forever() can be stopped from anywhere, eventlet
+        # and Werkzeug servers return from serve_forever() on SIGINT/SIGTERM
+        elif self._serving and self.socketio.async_mode == "gevent":
+            try:
+                self.socketio.stop()
+            except Exception as e:
+                self.logger.error(f"Error stopping web server: {e}")
         
-        # Server thread cannot be easily stopped, will be terminated when process exits
         self.logger.info("Web interface stopped")
@@ -0,0 +1,18 @@
+"""
+Gunicorn settings for serving the web interface created by web.server.create_app()
+
+Background tasks are started per worker once it has loaded the application, never
+in the master process.
+"""
+
+
+def post_worker_init(worker):
+    """Start status updates in a worker"""
+    worker.wsgi.extensions['web_interface'].start_status_updates()
+
+
+def worker_exit(server, worker):
+    """Stop status updates in a worker"""
+    web_interface = getattr(worker, 'wsgi', None) and worker.wsgi.extensions.get('web_interface')
+    if web_interface:
+        web_interface.stop_status_updates()
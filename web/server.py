@@ -10,16 +10,65 @@ import os
 import sys
 import json
 import logging
-import datetime
 import threading
 import time
+import hashlib
+import re
+import hmac
+import secrets
+import tempfile
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, wait
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session, flash, send_file
+import orjson
+from flask import Flask, Response, render_template, request, redirect, url_for, session, flash, send_file
+from flask.json.provider import JSONProvider
 from flask_socketio import SocketIO, emit
+from werkzeug.exceptions import HTTPException
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import escape
+from itsdangerous import TimestampSigner, BadSignature, SignatureExpired
+
+try:
+    from eventlet import patcher, tpool
+    EVENTLET_AVAILABLE = True
+except ImportError:
+    EVENTLET_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    from passlib.hash import pbkdf2_sha256
+    PASSLIB_AVAILABLE = True
+except ImportError:
+    PASSLIB_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+# Only looked up here, gunicorn is imported by run_production() and msgpack by python-socketio
+GUNICORN_AVAILABLE = importlib.util.find_spec('gunicorn') is not None
+MSGPACK_AVAILABLE = importlib.util.find_spec('msgpack') is not None
+GEVENT_WEBSOCKET_AVAILABLE = (importlib.util.find_spec('gevent') is not None
+                              and importlib.util.find_spec('geventwebsocket') is not None)
 
 # Add the parent directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -31,6 +80,650 @@ from core.logger import setup_logger
 # Create logger
 logger = logging.getLogger('web_server')
 
+# Socket.IO async modes supported by Flask-SocketIO
+ASYNC_MODES = ('eventlet', 'gevent', 'gevent_uwsgi', 'threading')
+
+# Settings exposed by the settings API, as (path, default) pairs
+SETTINGS_KEYS = (
+    ('system.units', 'metric'),
+    ('system.timezone', 'UTC'),
+    ('system.log_level', 'INFO'),
+    ('hardware.mower_width', 0.28),
+    ('hardware.wheel_diameter', 0.2),
+    ('hardware.wheel_base', 0.35),
+    ('hardware.max_speed', 0.5),
+    ('hardware.max_turn_rate', 45),
+    ('navigation.mowing_pattern', 'adaptive'),
+    ('navigation.line_direction', 0.0),
+    ('navigation.path_overlap_percent', 10.0),
+    ('navigation.perimeter_passes', 2),
+    ('navigation.obstacle_buffer', 0.3),
+    ('schedule.enabled', True),
+    ('schedule.max_run_time', 120),
+    ('schedule.rain_delay', 360),
+    ('security.pin_code', '0000'),
+    ('security.auto_lock', True),
+    ('security.lock_timeout', 300),
+    ('web.port', 8080),
+    ('web.enable_ssl', False)
+)
+
+# Redis key holding the id of the worker that broadcasts status
+STATUS_LEADER_KEY = 'robot_mower:web:status_leader'
+
+# Paths that can be requested without logging in, matched exactly or by prefix
+PUBLIC_PATHS = frozenset(('/login', '/api/v1/auth/token'))
+PUBLIC_PREFIXES = ('/static/',)
+
+# Stands in for the user name in pre-rendered pages
+PAGE_USER_MARKER = '__MOWER_PAGE_USER__'
+
+# API endpoints: (rule, WebInterface method and endpoint name, HTTP methods)
+API_ROUTES = (
+    ('/api/v1/auth/token', 'api_get_token', ['POST']),
+    ('/api/v1/status', 'api_status', ['GET']),
+    ('/api/v1/zones', 'api_get_zones', ['GET']),
+    ('/api/v1/zones/<int:zone_id>', 'api_get_zone', ['GET']),
+    ('/api/v1/zones', 'api_create_zone', ['POST']),
+    ('/api/v1/zones/<int:zone_id>', 'api_update_zone', ['PUT']),
+    ('/api/v1/zones/<int:zone_id>', 'api_delete_zone', ['DELETE']),
+    ('/api/v1/schedule', 'api_get_schedule', ['GET']),
+    ('/api/v1/schedule', 'api_add_schedule', ['POST']),
+    ('/api/v1/schedule/<int:schedule_id>', 'api_update_schedule', ['PUT']),
+    ('/api/v1/schedule/<int:schedule_id>', 'api_delete_schedule', ['DELETE']),
+    ('/api/v1/settings', 'api_get_settings', ['GET']),
+    ('/api/v1/settings', 'api_update_settings', ['PUT']),
+    ('/api/v1/maintenance', 'api_get_maintenance', ['GET']),
+    ('/api/v1/maintenance/<item_id>', 'api_record_maintenance', ['POST']),
+    ('/api/v1/lawn/health', 'api_get_lawn_health', ['GET']),
+    ('/api/v1/weather', 'api_get_weather', ['GET']),
+    ('/api/v1/activity', 'api_get_activity', ['GET']),
+    ('/api/v1/mower/manual-control', 'api_manual_control', ['POST']),
+    ('/api/v1/logs', 'api_get_logs', ['GET']),
+    ('/api/v1/perception/obstacles', 'api_get_obstacles', ['GET'])
+)
+
+# Mower API commands: action -> (controller method, accepts a zone_id)
+MOWER_ACTIONS = {
+    'start': ('start', True),
+    'stop': ('stop', False),
+    'pause': ('pause', False),
+    'dock': ('return_to_dock', False)
+}
+
+# Gunicorn worker classes for the async modes it can serve
+GUNICORN_WORKERS = {
+    'eventlet': 'eventlet',
+    'gevent': 'geventwebsocket.gunicorn.workers.GeventWebSocketWorker',
+    'threading': 'gthread'
+}
+
+# orjson options shared by all JSON output
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj: Any, **kwargs) -> str:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        return _json_bytes(orjson.dumps(self._prepare_response_obj(args, kwargs), option=ORJSON_OPTIONS))
+
+
+class OrjsonPackets:
+    """Minimal json-module replacement backed by orjson, for Socket.IO packet encoding"""
+    
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+    
+    @staticmethod
+    def loads(data: Any, **kwargs) -> Any:
+        return orjson.loads(data)
+
+
+# (second, formatted timestamp) of the last _now_iso() call
+_timestamp_cache = (0, '')
+
+
+def _now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string with second precision.
+    
+    The formatted string is reused until the second changes.
+    
+    Returns:
+        Timestamp such as 2025-03-09T23:45:12Z
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        cached = (now, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now)))
+        _timestamp_cache = cached
+    return cached[1]
+
+
+def _json(obj: Any) -> Response:
+    """
+    Create a JSON response using orjson.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        Flask response
+    """
+    return _json_bytes(orjson.dumps(obj, option=ORJSON_OPTIONS))
+
+
+def _json_bytes(data: bytes) -> Response:
+    """
+    Create a JSON response from already serialized data.
+    
+    Args:
+        data: Serialized JSON
+        
+    Returns:
+        Flask response
+    """
+    return Response(data, mimetype='application/json')
+
+
+def _etag(data: bytes) -> str:
+    """
+    Compute an entity tag.
+    
+    Args:
+        data: Body, or other bytes that change whenever the body does
+        
+    Returns:
+        Hex digest to use as ETag
+    """
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _conditional(response: Response, etag: str) -> Response:
+    """
+    Tag a response with an ETag and answer If-None-Match requests.
+    
+    Args:
+        response: Response to send
+        etag: Entity tag of the response, see _etag()
+        
+    Returns:
+        The response, turned into 304 Not Modified when the client copy is current
+    """
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+def _json_list_stream(key: str, items: Iterable[Any]) -> Response:
+    """
+    Create a streamed JSON response of the form {"success": true, key: [items]}.
+    
+    Items are encoded one at a time as the response is sent, so the whole body is
+    never held in memory.
+    
+    Args:
+        key: Name of the list in the response
+        items: Items to send
+        
+    Returns:
+        Flask response
+    """
+    def generate():
+        yield b'{"success":true,' + orjson.dumps(key) + b':['
+        separator = b''
+        for item in items:
+            yield separator + orjson.dumps(item, option=ORJSON_OPTIONS)
+            separator = b','
+        yield b']}'
+    
+    return Response(generate(), mimetype='application/json')
+
+
+# Request body schemas, fields are optional so the same schema covers updates
+ZONE_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'name': {'type': 'string', 'minLength': 1},
+        'active': {'type': 'boolean'},
+        'area': {'type': 'number', 'minimum': 0},
+        'mowing_pattern': {'type': 'string'},
+        'cutting_height': {'type': 'number', 'minimum': 0}
+    }
+}
+
+SCHEDULE_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'day': {'enum': ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']},
+        'start_time': {'type': 'string', 'pattern': '^([01][0-9]|2[0-3]):[0-5][0-9]$'},
+        'duration': {'type': 'number', 'minimum': 0},
+        'zone_id': {'type': 'integer', 'minimum': 0},
+        'active': {'type': 'boolean'}
+    }
+}
+
+
+# JSON schema types checked by the fallback validator, bool is excluded from the numbers
+_SCHEMA_TYPES = {
+    'object': lambda v: isinstance(v, dict),
+    'string': lambda v: isinstance(v, str),
+    'boolean': lambda v: isinstance(v, bool),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'integer': lambda v: isinstance(v, int) and not isinstance(v, bool)
+}
+
+
+def _fallback_validator(schema: Dict[str, Any]):
+    """
+    Create a validator for the subset of JSON schema used by the request schemas.
+    
+    Used when fastjsonschema is not installed. Checks the object type and, for each
+    property, type, enum, minLength, minimum and pattern.
+    
+    Args:
+        schema: JSON schema
+        
+    Returns:
+        Function that raises ValueError for invalid data
+    """
+    properties = [(name, rule, re.compile(rule['pattern']) if 'pattern' in rule else None)
+                  for name, rule in schema.get('properties', {}).items()]
+    
+    def validator(data):
+        if not _SCHEMA_TYPES[schema.get('type', 'object')](data):
+            raise ValueError(f"data must be {schema.get('type', 'object')}")
+        for name, rule, pattern in properties:
+            if name not in data:
+                continue
+            value = data[name]
+            if 'type' in rule and not _SCHEMA_TYPES[rule['type']](value):
+                raise ValueError(f"data.{name} must be {rule['type']}")
+            if 'enum' in rule and value not in rule['enum']:
+                raise ValueError(f"data.{name} must be one of {rule['enum']}")
+            if 'minLength' in rule and len(value) < rule['minLength']:
+                raise ValueError(f"data.{name} must be longer than or equal to {rule['minLength']} characters")
+            if 'minimum' in rule and value < rule['minimum']:
+                raise ValueError(f"data.{name} must be bigger than or equal to {rule['minimum']}")
+            if pattern and not pattern.search(value):
+                raise ValueError(f"data.{name} must match pattern {rule['pattern']}")
+    
+    return validator
+
+
+def _compile_validator(schema: Dict[str, Any]):
+    """
+    Compile a request body validator for a JSON schema.
+    
+    Args:
+        schema: JSON schema
+        
+    Returns:
+        Function that raises ValueError for invalid data
+    """
+    if not FASTJSONSCHEMA_AVAILABLE:
+        return _fallback_validator(schema)
+    
+    validate = fastjsonschema.compile(schema)
+    
+    def validator(data):
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValueError(e.message) from None
+    
+    return validator
+
+
+if not FASTJSONSCHEMA_AVAILABLE:
+    logger.warning("fastjsonschema is not installed, using the basic request body validation")
+_validate_zone = _compile_validator(ZONE_SCHEMA)
+_validate_schedule = _compile_validator(SCHEDULE_SCHEMA)
+
+
+# Status section of a service that has not answered yet
+_UNAVAILABLE_STATUS = {'available': False}
+
+# Placeholder status sections for services that are not available
+_DUMMY_MOWER_STATUS = {
+    'state': 'idle',
+    'progress': 0,
+    'runtime': 0,
+    'blade_rpm': 0,
+    'error': None
+}
+
+_DUMMY_POWER_STATUS = {
+    'battery_level': 85,
+    'charging': False,
+    'voltage': 24.5,
+    'current': 1.2,
+    'temperature': 28
+}
+
+_DUMMY_NAVIGATION_STATUS = {
+    'position': {'x': 12.5, 'y': 8.3},
+    'orientation': 45.0,
+    'speed': 0.0,
+    'gps_quality': 'good',
+    'satellites': 8
+}
+
+_DUMMY_ZONE_STATUS = {
+    'current_zone': 'Front Yard',
+    'current_zone_id': 1,
+    'zone_count': 4,
+    'active_zones': 3,
+    'total_area': 250
+}
+
+_DUMMY_SCHEDULE_STATUS = {
+    'enabled': True,
+    'next_mowing': 'Tomorrow 10:00',
+    'next_zone_id': 1,
+    'rain_delay_active': False
+}
+
+_DUMMY_MAINTENANCE_STATUS = {
+    'blade_wear': 15,
+    'total_mowing_hours': 45,
+    'maintenance_due': 'Filter cleaning in 2 hours'
+}
+
+_DUMMY_WEATHER_STATUS = {
+    'condition': 'clear',
+    'temperature': 22,
+    'humidity': 65,
+    'wind_speed': 3,
+    'rain_probability': 0,
+    'rain_expected_24h': False
+}
+
+_DUMMY_SYSTEM_STATUS = {
+    'cpu_usage': 25,
+    'memory_usage': 45,
+    'disk_usage': 30,
+    'temperature': 40,
+    'uptime': '2d 7h 35m'
+}
+
+# Placeholder responses for services that are not available, serialized once
+_DUMMY_ZONES_RESPONSE = orjson.dumps({
+    'success': True,
+    'zones': [
+        {
+            'id': 1,
+            'name': 'Front Yard',
+            'active': True,
+            'area': 60,
+            'mowing_pattern': 'grid',
+            'cutting_height': 45,
+            'last_mowed': '2 days ago',
+            'progress': 100
+        },
+        {
+            'id': 2,
+            'name': 'Back Yard',
+            'active': True,
+            'area': 120,
+            'mowing_pattern': 'lines',
+            'cutting_height': 50,
+            'last_mowed': 'Yesterday',
+            'progress': 75
+        },
+        {
+            'id': 3,
+            'name': 'Side Garden',
+            'active': True,
+            'area': 45,
+            'mowing_pattern': 'spiral',
+            'cutting_height': 35,
+            'last_mowed': '4 days ago',
+            'progress': 0
+        },
+        {
+            'id': 4,
+            'name': 'Play Area',
+            'active': False,
+            'area': 25,
+            'mowing_pattern': 'perimeter',
+            'cutting_height': 40,
+            'last_mowed': 'Never',
+            'progress': 0
+        }
+    ]
+}, option=ORJSON_OPTIONS)
+
+_DUMMY_SCHEDULE_RESPONSE = orjson.dumps({
+    'success': True,
+    'schedule': [
+        {
+            'id': 1,
+            'day': 'monday',
+            'start_time': '10:00',
+            'duration': 60,
+            'zone_id': 1,
+            'active': True
+        },
+        {
+            'id': 2,
+            'day': 'thursday',
+            'start_time': '14:00',
+            'duration': 90,
+            'zone_id': 2,
+            'active': True
+        },
+        {
+            'id': 3,
+            'day': 'saturday',
+            'start_time': '09:00',
+            'duration': 120,
+            'zone_id': 0,  # All zones
+            'active': True
+        }
+    ]
+}, option=ORJSON_OPTIONS)
+
+_DUMMY_MAINTENANCE_RESPONSE = orjson.dumps({
+    'success': True,
+    'maintenance': {
+        'blade_replacement': {
+            'name': 'Blade Replacement',
+            'last_maintenance': '2025-02-15T10:30:00Z',
+            'hours_run': 15,
+            'hours_interval': 25,
+            'due_in_hours': 10,
+            'status': 'ok'
+        },
+        'filter_cleaning': {
+            'name': 'Filter Cleaning',
+            'last_maintenance': '2025-03-01T14:00:00Z',
+            'hours_run': 8,
+            'hours_interval': 10,
+            'due_in_hours': 2,
+            'status': 'warning'
+        },
+        'general_inspection': {
+            'name': 'General Inspection',
+            'last_maintenance': '2025-02-01T09:00:00Z',
+            'hours_run': 45,
+            'hours_interval': 50,
+            'due_in_hours': 5,
+            'status': 'ok'
+        },
+        'wheel_cleaning': {
+            'name': 'Wheel Cleaning',
+            'last_maintenance': '2025-03-05T16:30:00Z',
+            'hours_run': 12,
+            'hours_interval': 10,
+            'due_in_hours': -2,
+            'status': 'overdue'
+        }
+    }
+}, option=ORJSON_OPTIONS)
+
+_DUMMY_LAWN_HEALTH_RESPONSE = orjson.dumps({
+    'success': True,
+    'health': {
+        'overall': 85,
+        'zones': {
+            1: 90,
+            2: 75,
+            3: 85,
+            4: 88
+        },
+        'recommendations': [
+            'Increase watering in zone 2',
+            'Consider fertilizing in the next week',
+            'Adjust cutting height to 5cm for better growth'
+        ]
+    }
+}, option=ORJSON_OPTIONS)
+
+_DUMMY_WEATHER_RESPONSE = orjson.dumps({
+    'success': True,
+    'weather': {
+        'current': {
+            'condition': 'clear',
+            'temperature': 22,
+            'humidity': 65,
+            'wind_speed': 3,
+            'rain_probability': 0
+        },
+        'forecast': [
+            {
+                'day': 'Today',
+                'condition': 'clear',
+                'temperature_high': 25,
+                'temperature_low': 18,
+                'rain_probability': 0
+            },
+            {
+                'day': 'Tomorrow',
+                'condition': 'cloudy',
+                'temperature_high': 23,
+                'temperature_low': 17,
+                'rain_probability': 30
+            },
+            {
+                'day': 'Day 3',
+                'condition': 'rain',
+                'temperature_high': 20,
+                'temperature_low': 15,
+                'rain_probability': 80
+            }
+        ]
+    }
+}, option=ORJSON_OPTIONS)
+
+_DUMMY_ACTIVITY_RESPONSE = orjson.dumps({
+    'success': True,
+    'activity': [
+        {
+            'id': 1,
+            'timestamp': '2025-03-09T21:00:00Z',
+            'type': 'mowing_completed',
+            'description': 'Front yard mowing completed successfully. 98% coverage achieved.',
+            'zone_id': 1
+        },
+        {
+            'id': 2,
+            'timestamp': '2025-03-09T19:00:00Z',
+            'type': 'obstacle_detected',
+            'description': 'Temporary obstacle detected and avoided in the east section.',
+            'zone_id': 1
+        },
+        {
+            'id': 3,
+            'timestamp': '2025-03-08T15:30:00Z',
+            'type': 'battery_charged',
+            'description': 'Battery charged to 100%. Charging time: 3h 25m.'
+        },
+        {
+            'id': 4,
+            'timestamp': '2025-03-07T12:00:00Z',
+            'type': 'system_update',
+            'description': 'System updated to version 2.1.4. New features added.'
+        }
+    ]
+}, option=ORJSON_OPTIONS)
+
+_DUMMY_LOGS = [
+    {
+        'timestamp': '2025-03-09T23:45:12Z',
+        'level': 'INFO',
+        'module': 'main',
+        'message': 'System started successfully'
+    },
+    {
+        'timestamp': '2025-03-09T23:45:15Z',
+        'level': 'INFO',
+        'module': 'navigation',
+        'message': 'GPS position acquired: 47.6062, -122.3321'
+    },
+    {
+        'timestamp': '2025-03-09T23:46:01Z',
+        'level': 'WARNING',
+        'module': 'mower',
+        'message': 'Battery level below 30%, consider charging soon'
+    },
+    {
+        'timestamp': '2025-03-09T23:47:30Z',
+        'level': 'INFO',
+        'module': 'theft_protection',
+        'message': 'Perimeter check complete, no intrusions detected'
+    }
+]
+
+_DUMMY_OBSTACLES_RESPONSE = orjson.dumps({
+    'success': True,
+    'obstacles': [
+        {
+            'id': 1,
+            'timestamp': '2025-03-10T00:10:15Z',
+            'class': 'person',
+            'confidence': 0.95,
+            'distance': 4.2,
+            'position': {
+                'x': 2.3,
+                'y': 1.5
+            },
+            'size': {
+                'width': 0.5,
+                'height': 1.7
+            },
+            'is_safety_critical': True
+        },
+        {
+            'id': 2,
+            'timestamp': '2025-03-10T00:10:15Z',
+            'class': 'dog',
+            'confidence': 0.87,
+            'distance': 6.1,
+            'position': {
+                'x': -1.2,
+                'y': 2.3
+            },
+            'size': {
+                'width': 0.4,
+                'height': 0.5
+            },
+            'is_safety_critical': True
+        }
+    ]
+}, option=ORJSON_OPTIONS)
+_DUMMY_OBSTACLES_ETAG = _etag(_DUMMY_OBSTACLES_RESPONSE)
+
+
 class User(UserMixin):
     """User class for Flask-Login"""
     def __init__(self, id, username, password_hash, role="user"):
@@ -41,6 +734,8 @@ class User(UserMixin):
     
     def check_password(self, password):
         """Check password hash"""
+        if PASSLIB_AVAILABLE and self.password_hash.startswith('$pbkdf2-sha256$'):
+            return pbkdf2_sha256.verify(password, self.password_hash)
         return check_password_hash(self.password_hash, password)
     
     def is_admin(self):
@@ -51,6 +746,19 @@ class User(UserMixin):
 class WebInterface:
     """Web interface for the Robot Mower Advanced system."""
     
+    __slots__ = (
+        'config', 'services', 'power_manager', 'navigation_manager', 'zone_manager',
+        'mower_controller', 'scheduler', 'maintenance_tracker', 'health_analyzer',
+        'growth_predictor', 'theft_protection', 'weather_scheduler',
+        'app', 'socketio', 'login_manager', 'token_max_age', '_token_signer',
+        'hash_iterations', 'password_hash_method', 'users',
+        'login_interval_ns', 'client_ip_header', '_login_attempts_size', '_login_attempts', '_login_attempts_lock', '_login_cache_size', '_login_cache', '_login_cache_lock', '_login_pepper',
+        '_page_cache', '_settings_cache',
+        'host', 'port', 'debug', 'enable_ssl', 'cert_file', 'key_file',
+        'max_open_files', 'listen_backlog', 'workers', 'worker_threads', 'worker_connections', 'log_file',
+        'message_queue', '_leader_redis', '_leader_id', '_is_leader', '_status_pool', 'status_interval', 'status_timeout', '_status_lock', '_status_pending', '_last_good_status', '_latest_status', 'status_thread', 'running', '_last_status_bytes'
+    )
+    
     def __init__(self, config, power_manager=None, navigation_manager=None, 
                  zone_manager=None, mower_controller=None, scheduler=None,
                  maintenance_tracker=None, health_analyzer=None, 
@@ -88,17 +796,111 @@ class WebInterface:
             'weather_scheduler': weather_scheduler
         }
         
+        # Bind services directly, request handlers use them on every call
+        self.power_manager = power_manager
+        self.navigation_manager = navigation_manager
+        self.zone_manager = zone_manager
+        self.mower_controller = mower_controller
+        self.scheduler = scheduler
+        self.maintenance_tracker = maintenance_tracker
+        self.health_analyzer = health_analyzer
+        self.growth_predictor = growth_predictor
+        self.theft_protection = theft_protection
+        self.weather_scheduler = weather_scheduler
+        
         # Create Flask app
         self.app = Flask(__name__, 
                           template_folder=os.path.join(os.path.dirname(__file__), 'templates'),
                           static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+        self.app.json = OrjsonProvider(self.app)
+        
+        # Accept URLs with or without a trailing slash instead of redirecting
+        self.app.url_map.strict_slashes = False
+        
+        # Templates only change on deployment, so keep compiled templates in memory
+        # and on disk instead of checking the source files on every render
+        if not config.get("web.debug", False):
+            self.app.config['TEMPLATES_AUTO_RELOAD'] = False
+            self.app.jinja_env.auto_reload = False
+        template_cache_dir = config.get("web.template_cache_dir",
+                                        os.path.join(tempfile.gettempdir(), 'mower_jinja_cache'))
+        try:
+            os.makedirs(template_cache_dir, exist_ok=True)
+            self.app.jinja_env.bytecode_cache = FileSystemBytecodeCache(template_cache_dir)
+        except OSError as e:
+            logger.warning(f"Template cache directory not available: {e}")
+        if not config.get("web.debug", False):
+            self._warm_template_cache()
+        
+        @self.app.context_processor
+        def inject_page_context():
+            """Provide the user name and current page to all templates"""
+            return {
+                'user': current_user.username if current_user.is_authenticated else None,
+                'page': request.endpoint
+            }
         
         # Set secret key for session management
-        secret_key = config.get("web.secret_key", os.urandom(24))
+        # The key is generated once and persisted, so sessions survive restarts
+        secret_key = config.get("web.secret_key")
+        if not secret_key:
+            secret_key = os.urandom(24)
+            config.set("web.secret_key", secret_key.hex())
+            try:
+                config.save()
+            except Exception as e:
+                logger.warning(f"Could not persist web.secret_key, sessions will not survive a restart: {e}")
+        elif isinstance(secret_key, str):
+            try:
+                secret_key = bytes.fromhex(secret_key)
+            except ValueError:
+                # Key set by hand rather than generated
+                secret_key = secret_key.encode('utf-8')
         self.app.secret_key = secret_key
         
+        # Signed bearer tokens for API clients, an alternative to the session cookie
+        self.token_max_age = config.get("web.token_max_age", 3600)
+        self._token_signer = TimestampSigner(secret_key, salt='api-token', digest_method=hashlib.blake2b)
+        
         # Initialize SocketIO
-        self.socketio = SocketIO(self.app, async_mode='eventlet', cors_allowed_origins="*")
+        # MOWER_ASYNC_MODE overrides the configuration, the python -m web entry point
+        # patches the process for it before this module is imported
+        async_mode = os.environ.get("MOWER_ASYNC_MODE") or config.get("web.async_mode", "eventlet")
+        if async_mode not in ASYNC_MODES:
+            logger.warning(f"Unsupported web.async_mode '{async_mode}', using eventlet")
+            async_mode = 'eventlet'
+        if async_mode == 'eventlet' and not EVENTLET_AVAILABLE:
+            logger.warning("eventlet is not installed, falling back to threading")
+            async_mode = 'threading'
+        if async_mode == 'eventlet' and not patcher.is_monkey_patched('thread'):
+            logger.warning("eventlet selected but the process is not monkey-patched "
+                           "(start with python -m web), falling back to threading")
+            async_mode = 'threading'
+        if async_mode == 'gevent' and not GEVENT_WEBSOCKET_AVAILABLE:
+            logger.warning("gevent or gevent-websocket is not installed, falling back to threading")
+            async_mode = 'threading'
+        # With a message queue, emits reach clients connected to any web worker
+        self.message_queue = config.get("web.message_queue")
+        
+        # Binary msgpack packets are smaller than JSON, pages then load the msgpack client parser
+        socketio_msgpack = config.get("web.socketio_serializer", "json") == "msgpack"
+        if socketio_msgpack and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack is not installed, using JSON Socket.IO packets")
+            socketio_msgpack = False
+        self.app.jinja_env.globals['socketio_msgpack'] = socketio_msgpack
+        
+        # Clients connect over WebSocket only, without the long-polling fallback. Without
+        # configured origins only pages served by this server may connect.
+        self.socketio = SocketIO(self.app,
+                                 async_mode=async_mode,
+                                 message_queue=self.message_queue,
+                                 cors_allowed_origins=config.get("web.cors_origins"),
+                                 transports=['websocket'],
+                                 ping_interval=25,
+                                 ping_timeout=20,
+                                 max_http_buffer_size=16384,
+                                 serializer='msgpack' if socketio_msgpack else 'default',
+                                 json=OrjsonPackets)
         
         # Initialize login manager
         self.login_manager = LoginManager()
@@ -106,8 +908,29 @@ class WebInterface:
         self.login_manager.login_view = 'login'
         
         # Set up users
+        self.hash_iterations = config.get("web.hash_iterations", 120000)
+        self.password_hash_method = f"pbkdf2:sha256:{self.hash_iterations}"
         self.users = self._load_users()
         
+        # Last login attempt per client address, see _login_rate_limited()
+        self.login_interval_ns = int(config.get("web.login_interval_ms", 200) * 1_000_000)
+        self.client_ip_header = config.get("web.client_ip_header")
+        self._login_attempts_size = 4096
+        self._login_attempts: "OrderedDict[str, int]" = OrderedDict()
+        self._login_attempts_lock = threading.Lock()
+        
+        # Recent password check results, see _check_password()
+        self._login_cache_size = 1024
+        self._login_cache = OrderedDict()
+        self._login_cache_lock = threading.Lock()
+        self._login_pepper = secrets.token_bytes(32)  # per process, never persisted
+        
+        # Pages rendered once with PAGE_USER_MARKER in place of the user name, by template
+        self._page_cache: Dict[str, bytes] = {}
+        
+        # Configuration version and serialized settings response, see api_get_settings()
+        self._settings_cache: Optional[Tuple[int, bytes]] = None
+        
         # Set up routes and Socket.IO event handlers
         self._setup_routes()
         self._setup_socketio_events()
@@ -117,6 +940,16 @@ class WebInterface:
         self.port = config.get("web.port", 8080)
         self.debug = config.get("web.debug", False)
         self.enable_ssl = config.get("web.enable_ssl", False)
+        self.max_open_files = config.get("web.max_open_files", 65536)
+        self.listen_backlog = config.get("web.listen_backlog", 2048)
+        self.workers = config.get("web.workers", 1) or os.cpu_count() or 1
+        if self.workers > 1 and not self.message_queue:
+            # Without a shared message queue each worker only reaches its own clients
+            logger.warning("web.workers needs web.message_queue to run more than one worker, using 1")
+            self.workers = 1
+        self.worker_threads = config.get("web.worker_threads", 8)
+        self.worker_connections = config.get("web.worker_connections", 2000)
+        self.log_file = config.get("system.log_file", "")
         
         # SSL certificate and key paths
         if self.enable_ssl:
@@ -127,10 +960,28 @@ class WebInterface:
                 logger.warning("SSL certificate or key not found, disabling HTTPS")
                 self.enable_ssl = False
         
-        # Status update thread
+        # Status update task
+        self._status_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='status')
+        self.status_interval = config.get("web.status_interval", 1.0)  # seconds
+        self.status_timeout = config.get("web.status_timeout", 0.8)  # seconds
+        self._status_lock = threading.Lock()
+        self._status_pending: Dict[str, Any] = {}
+        self._last_good_status: Dict[str, Any] = {}
+        self._latest_status: Optional[Dict[str, Any]] = None
         self.status_thread = None
         self.running = False
         
+        # Only one worker sharing the message queue produces the status, see _is_status_leader()
+        self._leader_redis = None
+        if self.message_queue and self.message_queue.startswith(('redis://', 'rediss://')):
+            if REDIS_AVAILABLE:
+                self._leader_redis = redis.Redis.from_url(self.message_queue)
+            else:
+                logger.warning("redis is not installed, every web worker will broadcast status")
+        self._leader_id = secrets.token_hex(8).encode('utf-8')
+        self._is_leader = False
+        self._last_status_bytes: Dict[str, bytes] = {}  # last broadcast section, encoded
+        
         logger.info("Web interface initialized")
     
     def _load_users(self) -> Dict[str, User]:
@@ -150,7 +1001,7 @@ class WebInterface:
         users[admin_username] = User(
             id=admin_username,
             username=admin_username,
-            password_hash=generate_password_hash(admin_password),
+            password_hash=self._hash_password(admin_password),
             role="admin"
         )
         
@@ -167,25 +1018,131 @@ class WebInterface:
         
         return users
     
-    @property
-    def mower_controller(self):
-        """Get mower controller"""
-        return self.services.get('mower_controller')
+    def _hash_password(self, password: str) -> str:
+        """
+        Hash a password with the configured cost.
+        
+        Uses passlib's PBKDF2-SHA256 when available, werkzeug's otherwise. Both kinds
+        of hashes are accepted by User.check_password().
+        
+        Args:
+            password: Password to hash
+            
+        Returns:
+            Password hash
+        """
+        if PASSLIB_AVAILABLE:
+            return pbkdf2_sha256.using(rounds=self.hash_iterations).hash(password)
+        return generate_password_hash(password, method=self.password_hash_method)
+    
+    def _client_address(self) -> str:
+        """
+        Get the address of the client making the request.
+        
+        Behind a reverse proxy every request comes from the proxy, so the address is
+        taken from web.client_ip_header when it is configured. For X-Forwarded-For
+        style lists the last entry is used, it is the one added by the trusted proxy.
+        
+        Returns:
+            Client address
+        """
+        if self.client_ip_header:
+            forwarded = request.headers.get(self.client_ip_header)
+            if forwarded:
+                return forwarded.rsplit(',', 1)[-1].strip()
+        return request.remote_addr or ''
+    
+    def _login_rate_limited(self) -> bool:
+        """
+        Check whether the client made another login attempt too recently.
+        
+        Each client address is allowed one attempt per web.login_interval_ms, the most
+        recently seen addresses are tracked. Limited attempts are rejected before the
+        password hash runs, so a login flood cannot monopolize the worker.
+        
+        Returns:
+            True if the attempt should be rejected
+        """
+        address = self._client_address()
+        now = time.monotonic_ns()
+        with self._login_attempts_lock:
+            last = self._login_attempts.get(address)
+            if last is not None and now - last < self.login_interval_ns:
+                return True
+            self._login_attempts[address] = now
+            self._login_attempts.move_to_end(address)
+            if len(self._login_attempts) > self._login_attempts_size:
+                self._login_attempts.popitem(last=False)
+        return False
     
-    @property
-    def navigation_manager(self):
-        """Get navigation manager"""
-        return self.services.get('navigation_manager')
+    def _check_password(self, user: User, password: str) -> bool:
+        """
+        Check a user's password, reusing the result of identical recent attempts.
+        
+        Results are cached by a keyed fingerprint of the password, so repeated logins
+        skip the password hash. The stored hash is part of the key, which makes cached
+        results stale as soon as the password changes.
+        
+        Args:
+            user: User logging in
+            password: Submitted password
+            
+        Returns:
+            True if the password matches
+        """
+        fingerprint = hmac.new(self._login_pepper, password.encode('utf-8'), hashlib.sha256).digest()
+        key = (user.id, user.password_hash, fingerprint)
+        
+        with self._login_cache_lock:
+            cached = self._login_cache.get(key)
+            if cached is not None:
+                self._login_cache.move_to_end(key)
+                return cached
+        
+        if EVENTLET_AVAILABLE and self.socketio.async_mode == 'eventlet':
+            # Hash in a native thread so the event loop keeps serving other clients
+            result = tpool.execute(user.check_password, password)
+        else:
+            result = user.check_password(password)
+        
+        with self._login_cache_lock:
+            self._login_cache[key] = result
+            if len(self._login_cache) > self._login_cache_size:
+                self._login_cache.popitem(last=False)
+        
+        return result
     
-    @property
-    def zone_manager(self):
-        """Get zone manager"""
-        return self.services.get('zone_manager')
+    def _render_page(self, template: str) -> Response:
+        """
+        Render a page for the logged in user.
+        
+        Pages only depend on the user name, so each page is rendered once and the
+        name is filled in per request. Debug mode renders every time so template
+        changes show up.
+        
+        Args:
+            template: Template name
+            
+        Returns:
+            Rendered page
+        """
+        html = self._page_cache.get(template)
+        if html is None:
+            html = render_template(template, user=PAGE_USER_MARKER).encode('utf-8')
+            if not self.debug:
+                self._page_cache[template] = html
+        
+        user = str(escape(current_user.username)).encode('utf-8')
+        return Response(html.replace(PAGE_USER_MARKER.encode('utf-8'), user), mimetype='text/html')
     
-    @property
-    def scheduler(self):
-        """Get scheduler"""
-        return self.services.get('scheduler')
+    def _warm_template_cache(self) -> None:
+        """Compile all templates at startup so the first requests don't parse them"""
+        env = self.app.jinja_env
+        for name in env.list_templates(extensions=['html']):
+            try:
+                env.get_template(name)
+            except Exception as e:
+                logger.warning(f"Could not compile template {name}: {e}")
     
     def _setup_routes(self):
         """Set up Flask routes for the web interface."""
@@ -195,12 +1152,48 @@ class WebInterface:
             """Load user for Flask-Login"""
             return self.users.get(user_id)
         
+        @self.login_manager.request_loader
+        def load_user_from_request(request):
+            """Load user from a bearer token on API requests without a session"""
+            auth = request.headers.get('Authorization', '')
+            if not auth.startswith('Bearer ') or not request.path.startswith('/api/v1/'):
+                return None
+            
+            try:
+                user_id = self._token_signer.unsign(auth[7:], max_age=self.token_max_age).decode('utf-8')
+            except (BadSignature, SignatureExpired):
+                return None
+            return self.users.get(user_id)
+        
+        @self.app.before_request
+        def require_login():
+            """Require a logged in user for everything except the public paths"""
+            path = request.path
+            if path in PUBLIC_PATHS or path.startswith(PUBLIC_PREFIXES) or request.method == 'OPTIONS':
+                # OPTIONS is exempt like with login_required, for CORS preflight requests
+                return None
+            if not current_user.is_authenticated:
+                if path.startswith('/api/'):
+                    return _json({'success': False, 'error': 'Authentication required'}), 401
+                return redirect(url_for('login', next=path))
+            return None
+        
+        @self.app.errorhandler(Exception)
+        def handle_api_error(e):
+            """Report errors from API endpoints to the client as a failed result"""
+            if isinstance(e, HTTPException):
+                return e
+            if not request.path.startswith('/api/v1/'):
+                raise e
+            
+            if not isinstance(e, ValueError):
+                logger.error(f"Error handling {request.method} {request.path}: {e}")
+            return _json({'success': False, 'error': str(e)})
+        
         @self.app.route('/')
         def index():
-            """Render main page or redirect to login"""
-            if not current_user.is_authenticated:
-                return redirect(url_for('login'))
-            return render_template('index.html', user=current_user.username, page='index')
+            """Render main page"""
+            return self._render_page('index.html')
         
         @self.app.route('/login', methods=['GET', 'POST'])
         def login():
@@ -213,7 +1206,9 @@ class WebInterface:
                 password = request.form.get('password')
                 
                 user = self.users.get(username)
-                if user and user.check_password(password):
+                if self._login_rate_limited():
+                    flash('Too many login attempts, please wait a moment', 'danger')
+                elif user and password and self._check_password(user, password):
                     login_user(user)
                     next_page = request.args.get('next')
                     return redirect(next_page or url_for('index'))
@@ -230,622 +1225,323 @@ class WebInterface:
             return redirect(url_for('login'))
         
         @self.app.route('/dashboard')
-        @login_required
         def dashboard():
             """Render dashboard page"""
-            return render_template('additional/dashboard.html', user=current_user.username, page='dashboard')
+            return self._render_page('additional/dashboard.html')
         
         @self.app.route('/zones')
-        @login_required
         def zones():
             """Render zones page"""
-            return render_template('additional/zones.html', user=current_user.username, page='zones')
+            return self._render_page('additional/zones.html')
         
         @self.app.route('/schedule')
-        @login_required
         def schedule():
             """Render schedule page"""
-            return render_template('additional/schedule.html', user=current_user.username, page='schedule')
+            return self._render_page('additional/schedule.html')
         
         @self.app.route('/maintenance')
-        @login_required
         def maintenance():
             """Render maintenance page"""
-            return render_template('additional/maintenance.html', user=current_user.username, page='maintenance')
+            return self._render_page('additional/maintenance.html')
         
         @self.app.route('/settings')
-        @login_required
         def settings():
             """Render settings page"""
-            return render_template('additional/settings.html', user=current_user.username, page='settings')
+            return self._render_page('additional/settings.html')
         
-        @self.app.route('/api/v1/status')
-        @login_required
-        def api_status():
-            """API endpoint for getting system status"""
-            return jsonify(self._get_status())
+        # API endpoints are bound methods, see API_ROUTES
+        for rule, endpoint, methods in API_ROUTES:
+            self.app.add_url_rule(rule, endpoint, getattr(self, endpoint), methods=methods)
         
-        @self.app.route('/api/v1/mower/start', methods=['POST'])
-        @login_required
-        def api_start_mower():
-            """API endpoint for starting the mower"""
-            zone_id = request.json.get('zone_id') if request.json else None
+        for action in MOWER_ACTIONS:
+            self.app.add_url_rule(f'/api/v1/mower/{action}', f'api_{action}_mower', self.api_mower_action,
+                                  methods=['POST'], defaults={'action': action})
+    
+    def api_mower_action(self, action):
+        """API endpoint for the mower commands in MOWER_ACTIONS"""
+        mower_controller = self.mower_controller
+        if not mower_controller:
+            return _json({'success': False, 'error': 'Mower controller not available'})
+        
+        method, takes_zone = MOWER_ACTIONS[action]
+        kwargs = {}
+        if takes_zone:
+            kwargs['zone_id'] = (request.get_json(silent=True) or {}).get('zone_id')
+        
+        success = getattr(mower_controller, method)(**kwargs)
+        return _json({'success': success})
+    
+    def api_get_token(self):
+        """API endpoint for getting a bearer token"""
+        if current_user.is_authenticated:
+            user = current_user
+        else:
+            if self._login_rate_limited():
+                return _json({'success': False, 'error': 'Too many login attempts'}), 429
+                
+            credentials = request.get_json(silent=True) or {}
+            user = self.users.get(credentials.get('username'))
+            password = credentials.get('password')
+            if not (user and password and self._check_password(user, password)):
+                return _json({'success': False, 'error': 'Invalid username or password'}), 401
             
-            if self.mower_controller:
-                success = self.mower_controller.start(zone_id=zone_id)
-                return jsonify({'success': success})
+        token = self._token_signer.sign(user.id).decode('utf-8')
+        return _json({'success': True, 'token': token, 'expires_in': self.token_max_age})
+    
+    def api_status(self):
+        """API endpoint for getting system status"""
+        return _json(self._current_status())
+    
+    def api_get_zones(self):
+        """API endpoint for getting zones"""
+        if self.zone_manager:
+            return _json_list_stream('zones', self.zone_manager.get_zones())
             
-            return jsonify({'success': False, 'error': 'Mower controller not available'})
-        
-        @self.app.route('/api/v1/mower/stop', methods=['POST'])
-        @login_required
-        def api_stop_mower():
-            """API endpoint for stopping the mower"""
-            if self.mower_controller:
-                success = self.mower_controller.stop()
-                return jsonify({'success': success})
+        # Return dummy data if zone manager not available
+        return _json_bytes(_DUMMY_ZONES_RESPONSE)
+    
+    def api_get_zone(self, zone_id):
+        """API endpoint for getting a specific zone"""
+        if self.zone_manager:
+            zone = self.zone_manager.get_zone(zone_id)
+            if zone:
+                return _json({'success': True, 'zone': zone})
+            return _json({'success': False, 'error': 'Zone not found'})
             
-            return jsonify({'success': False, 'error': 'Mower controller not available'})
-        
-        @self.app.route('/api/v1/mower/pause', methods=['POST'])
-        @login_required
-        def api_pause_mower():
-            """API endpoint for pausing the mower"""
-            if self.mower_controller:
-                success = self.mower_controller.pause()
-                return jsonify({'success': success})
+        return _json({'success': False, 'error': 'Zone manager not available'})
+    
+    def api_create_zone(self):
+        """API endpoint for creating a zone"""
+        if not self.zone_manager:
+            return _json({'success': False, 'error': 'Zone manager not available'})
             
-            return jsonify({'success': False, 'error': 'Mower controller not available'})
-        
-        @self.app.route('/api/v1/mower/dock', methods=['POST'])
-        @login_required
-        def api_dock_mower():
-            """API endpoint for docking the mower"""
-            if self.mower_controller:
-                success = self.mower_controller.return_to_dock()
-                return jsonify({'success': success})
+        zone_data = request.get_json(silent=True)
+        if not zone_data:
+            return _json({'success': False, 'error': 'No data provided'})
             
-            return jsonify({'success': False, 'error': 'Mower controller not available'})
-        
-        @self.app.route('/api/v1/zones', methods=['GET'])
-        @login_required
-        def api_get_zones():
-            """API endpoint for getting zones"""
-            if self.zone_manager:
-                zones = self.zone_manager.get_zones()
-                return jsonify({'success': True, 'zones': zones})
+        _validate_zone(zone_data)
             
-            # Return dummy data if zone manager not available
-            return jsonify({
-                'success': True,
-                'zones': [
-                    {
-                        'id': 1,
-                        'name': 'Front Yard',
-                        'active': True,
-                        'area': 60,
-                        'mowing_pattern': 'grid',
-                        'cutting_height': 45,
-                        'last_mowed': '2 days ago',
-                        'progress': 100
-                    },
-                    {
-                        'id': 2,
-                        'name': 'Back Yard',
-                        'active': True,
-                        'area': 120,
-                        'mowing_pattern': 'lines',
-                        'cutting_height': 50,
-                        'last_mowed': 'Yesterday',
-                        'progress': 75
-                    },
-                    {
-                        'id': 3,
-                        'name': 'Side Garden',
-                        'active': True,
-                        'area': 45,
-                        'mowing_pattern': 'spiral',
-                        'cutting_height': 35,
-                        'last_mowed': '4 days ago',
-                        'progress': 0
-                    },
-                    {
-                        'id': 4,
-                        'name': 'Play Area',
-                        'active': False,
-                        'area': 25,
-                        'mowing_pattern': 'perimeter',
-                        'cutting_height': 40,
-                        'last_mowed': 'Never',
-                        'progress': 0
-                    }
-                ]
-            })
-        
-        @self.app.route('/api/v1/zones/<int:zone_id>', methods=['GET'])
-        @login_required
-        def api_get_zone(zone_id):
-            """API endpoint for getting a specific zone"""
-            if self.zone_manager:
-                zone = self.zone_manager.get_zone(zone_id)
-                if zone:
-                    return jsonify({'success': True, 'zone': zone})
-                return jsonify({'success': False, 'error': 'Zone not found'})
+        zone_id = self.zone_manager.add_zone(zone_data)
+        return _json({'success': True, 'zone_id': zone_id})
+    
+    def api_update_zone(self, zone_id):
+        """API endpoint for updating a zone"""
+        if not self.zone_manager:
+            return _json({'success': False, 'error': 'Zone manager not available'})
             
-            return jsonify({'success': False, 'error': 'Zone manager not available'})
-        
-        @self.app.route('/api/v1/zones', methods=['POST'])
-        @login_required
-        def api_create_zone():
-            """API endpoint for creating a zone"""
-            if not self.zone_manager:
-                return jsonify({'success': False, 'error': 'Zone manager not available'})
+        zone_data = request.get_json(silent=True)
+        if not zone_data:
+            return _json({'success': False, 'error': 'No data provided'})
             
-            zone_data = request.json
-            if not zone_data:
-                return jsonify({'success': False, 'error': 'No data provided'})
+        _validate_zone(zone_data)
             
-            try:
-                zone_id = self.zone_manager.add_zone(zone_data)
-                return jsonify({'success': True, 'zone_id': zone_id})
-            except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
-        
-        @self.app.route('/api/v1/zones/<int:zone_id>', methods=['PUT'])
-        @login_required
-        def api_update_zone(zone_id):
-            """API endpoint for updating a zone"""
-            if not self.zone_manager:
-                return jsonify({'success': False, 'error': 'Zone manager not available'})
+        success = self.zone_manager.update_zone(zone_id, zone_data)
+        return _json({'success': success})
+    
+    def api_delete_zone(self, zone_id):
+        """API endpoint for deleting a zone"""
+        if not self.zone_manager:
+            return _json({'success': False, 'error': 'Zone manager not available'})
             
-            zone_data = request.json
-            if not zone_data:
-                return jsonify({'success': False, 'error': 'No data provided'})
+        success = self.zone_manager.delete_zone(zone_id)
+        return _json({'success': success})
+    
+    def api_get_schedule(self):
+        """API endpoint for getting the schedule"""
+        if self.scheduler:
+            return _json_list_stream('schedule', self.scheduler.get_schedule())
             
-            try:
-                success = self.zone_manager.update_zone(zone_id, zone_data)
-                return jsonify({'success': success})
-            except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
-        
-        @self.app.route('/api/v1/zones/<int:zone_id>', methods=['DELETE'])
-        @login_required
-        def api_delete_zone(zone_id):
-            """API endpoint for deleting a zone"""
-            if not self.zone_manager:
-                return jsonify({'success': False, 'error': 'Zone manager not available'})
+        # Return dummy schedule data if scheduler not available
+        return _json_bytes(_DUMMY_SCHEDULE_RESPONSE)
+    
+    def api_add_schedule(self):
+        """API endpoint for adding a schedule item"""
+        if not self.scheduler:
+            return _json({'success': False, 'error': 'Scheduler not available'})
             
-            try:
-                success = self.zone_manager.delete_zone(zone_id)
-                return jsonify({'success': success})
-            except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
-        
-        @self.app.route('/api/v1/schedule', methods=['GET'])
-        @login_required
-        def api_get_schedule():
-            """API endpoint for getting the schedule"""
-            if self.scheduler:
-                schedule = self.scheduler.get_schedule()
-                return jsonify({'success': True, 'schedule': schedule})
+        schedule_data = request.get_json(silent=True)
+        if not schedule_data:
+            return _json({'success': False, 'error': 'No data provided'})
             
-            # Return dummy schedule data if scheduler not available
-            return jsonify({
-                'success': True,
-                'schedule': [
-                    {
-                        'id': 1,
-                        'day': 'monday',
-                        'start_time': '10:00',
-                        'duration': 60,
-                        'zone_id': 1,
-                        'active': True
-                    },
-                    {
-                        'id': 2,
-                        'day': 'thursday',
-                        'start_time': '14:00',
-                        'duration': 90,
-                        'zone_id': 2,
-                        'active': True
-                    },
-                    {
-                        'id': 3,
-                        'day': 'saturday',
-                        'start_time': '09:00',
-                        'duration': 120,
-                        'zone_id': 0,  # All zones
-                        'active': True
-                    }
-                ]
-            })
-        
-        @self.app.route('/api/v1/schedule', methods=['POST'])
-        @login_required
-        def api_add_schedule():
-            """API endpoint for adding a schedule item"""
-            if not self.scheduler:
-                return jsonify({'success': False, 'error': 'Scheduler not available'})
+        _validate_schedule(schedule_data)
             
-            schedule_data = request.json
-            if not schedule_data:
-                return jsonify({'success': False, 'error': 'No data provided'})
+        schedule_id = self.scheduler.add_schedule(schedule_data)
+        return _json({'success': True, 'schedule_id': schedule_id})
+    
+    def api_update_schedule(self, schedule_id):
+        """API endpoint for updating a schedule item"""
+        if not self.scheduler:
+            return _json({'success': False, 'error': 'Scheduler not available'})
             
-            try:
-                schedule_id = self.scheduler.add_schedule(schedule_data)
-                return jsonify({'success': True, 'schedule_id': schedule_id})
-            except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
-        
-        @self.app.route('/api/v1/schedule/<int:schedule_id>', methods=['PUT'])
-        @login_required
-        def api_update_schedule(schedule_id):
-            """API endpoint for updating a schedule item"""
-            if not self.scheduler:
-                return jsonify({'success': False, 'error': 'Scheduler not available'})
+        schedule_data = request.get_json(silent=True)
+        if not schedule_data:
+            return _json({'success': False, 'error': 'No data provided'})
             
-            schedule_data = request.json
-            if not schedule_data:
-                return jsonify({'success': False, 'error': 'No data provided'})
+        _validate_schedule(schedule_data)
             
-            try:
-                success = self.scheduler.update_schedule(schedule_id, schedule_data)
-                return jsonify({'success': success})
-            except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
-        
-        @self.app.route('/api/v1/schedule/<int:schedule_id>', methods=['DELETE'])
-        @login_required
-        def api_delete_schedule(schedule_id):
-            """API endpoint for deleting a schedule item"""
-            if not self.scheduler:
-                return jsonify({'success': False, 'error': 'Scheduler not available'})
+        success = self.scheduler.update_schedule(schedule_id, schedule_data)
+        return _json({'success': success})
+    
+    def api_delete_schedule(self, schedule_id):
+        """API endpoint for deleting a schedule item"""
+        if not self.scheduler:
+            return _json({'success': False, 'error': 'Scheduler not available'})
             
-            try:
-                success = self.scheduler.delete_schedule(schedule_id)
-                return jsonify({'success': success})
-            except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
-        
-        @self.app.route('/api/v1/settings', methods=['GET'])
-        @login_required
-        def api_get_settings():
-            """API endpoint for getting settings"""
-            # Get settings from configuration
-            settings = {
-                'system': {
-                    'units': self.config.get('system.units', 'metric'),
-                    'timezone': self.config.get('system.timezone', 'UTC'),
-                    'log_level': self.config.get('system.log_level', 'INFO')
-                },
-                'hardware': {
-                    'mower_width': self.config.get('hardware.mower_width', 0.28),
-                    'wheel_diameter': self.config.get('hardware.wheel_diameter', 0.2),
-                    'wheel_base': self.config.get('hardware.wheel_base', 0.35),
-                    'max_speed': self.config.get('hardware.max_speed', 0.5),
-                    'max_turn_rate': self.config.get('hardware.max_turn_rate', 45)
-                },
-                'navigation': {
-                    'mowing_pattern': self.config.get('navigation.mowing_pattern', 'adaptive'),
-                    'line_direction': self.config.get('navigation.line_direction', 0.0),
-                    'path_overlap_percent': self.config.get('navigation.path_overlap_percent', 10.0),
-                    'perimeter_passes': self.config.get('navigation.perimeter_passes', 2),
-                    'obstacle_buffer': self.config.get('navigation.obstacle_buffer', 0.3)
-                },
-                'schedule': {
-                    'enabled': self.config.get('schedule.enabled', True),
-                    'max_run_time': self.config.get('schedule.max_run_time', 120),
-                    'rain_delay': self.config.get('schedule.rain_delay', 360)
-                },
-                'security': {
-                    'pin_code': self.config.get('security.pin_code', '0000'),
-                    'auto_lock': self.config.get('security.auto_lock', True),
-                    'lock_timeout': self.config.get('security.lock_timeout', 300)
-                },
-                'web': {
-                    'port': self.config.get('web.port', 8080),
-                    'enable_ssl': self.config.get('web.enable_ssl', False)
-                }
-            }
+        success = self.scheduler.delete_schedule(schedule_id)
+        return _json({'success': success})
+    
+    def api_get_settings(self):
+        """API endpoint for getting settings"""
+        # The cache is keyed by the configuration version, so changes made anywhere
+        # else through the configuration manager also invalidate it
+        version = self.config.version
+        cached = self._settings_cache
+        if cached is not None and cached[0] == version:
+            return _json_bytes(cached[1])
             
-            return jsonify({'success': True, 'settings': settings})
-        
-        @self.app.route('/api/v1/settings', methods=['PUT'])
-        @login_required
-        def api_update_settings():
-            """API endpoint for updating settings"""
-            if not current_user.is_admin():
-                return jsonify({'success': False, 'error': 'Admin privileges required'})
+        # Get settings from configuration
+        settings = {}
+        for path, value in self.config.get_many(SETTINGS_KEYS).items():
+            section, key = path.split('.', 1)
+            settings.setdefault(section, {})[key] = value
             
-            settings = request.json
-            if not settings:
-                return jsonify({'success': False, 'error': 'No data provided'})
+        body = orjson.dumps({'success': True, 'settings': settings}, option=ORJSON_OPTIONS)
+        self._settings_cache = (version, body)
+        return _json_bytes(body)
+    
+    def api_update_settings(self):
+        """API endpoint for updating settings"""
+        if not current_user.is_admin():
+            return _json({'success': False, 'error': 'Admin privileges required'})
             
-            # Update settings in configuration
-            try:
-                for section, values in settings.items():
-                    for key, value in values.items():
-                        self.config.set(f"{section}.{key}", value)
-                
-                # Save configuration
-                self.config.save()
-                
-                return jsonify({'success': True})
-            except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
-        
-        @self.app.route('/api/v1/maintenance', methods=['GET'])
-        @login_required
-        def api_get_maintenance():
-            """API endpoint for getting maintenance information"""
-            if self.services.get('maintenance_tracker'):
-                maintenance = self.services['maintenance_tracker'].get_maintenance_info()
-                return jsonify({'success': True, 'maintenance': maintenance})
+        settings = request.get_json(silent=True)
+        if not settings:
+            return _json({'success': False, 'error': 'No data provided'})
             
-            # Return dummy maintenance data if tracker not available
-            return jsonify({
-                'success': True,
-                'maintenance': {
-                    'blade_replacement': {
-                        'name': 'Blade Replacement',
-                        'last_maintenance': '2025-02-15T10:30:00Z',
-                        'hours_run': 15,
-                        'hours_interval': 25,
-                        'due_in_hours': 10,
-                        'status': 'ok'
-                    },
-                    'filter_cleaning': {
-                        'name': 'Filter Cleaning',
-                        'last_maintenance': '2025-03-01T14:00:00Z',
-                        'hours_run': 8,
-                        'hours_interval': 10,
-                        'due_in_hours': 2,
-                        'status': 'warning'
-                    },
-                    'general_inspection': {
-                        'name': 'General Inspection',
-                        'last_maintenance': '2025-02-01T09:00:00Z',
-                        'hours_run': 45,
-                        'hours_interval': 50,
-                        'due_in_hours': 5,
-                        'status': 'ok'
-                    },
-                    'wheel_cleaning': {
-                        'name': 'Wheel Cleaning',
-                        'last_maintenance': '2025-03-05T16:30:00Z',
-                        'hours_run': 12,
-                        'hours_interval': 10,
-                        'due_in_hours': -2,
-                        'status': 'overdue'
-                    }
-                }
-            })
-        
-        @self.app.route('/api/v1/maintenance/<item_id>', methods=['POST'])
-        @login_required
-        def api_record_maintenance(item_id):
-            """API endpoint for recording maintenance"""
-            if not self.services.get('maintenance_tracker'):
-                return jsonify({'success': False, 'error': 'Maintenance tracker not available'})
+        # Update settings in configuration
+        for section, values in settings.items():
+            for key, value in values.items():
+                self.config.set(f"{section}.{key}", value)
             
-            try:
-                success = self.services['maintenance_tracker'].record_maintenance(item_id)
-                return jsonify({'success': success})
-            except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
-        
-        @self.app.route('/api/v1/lawn/health', methods=['GET'])
-        @login_required
-        def api_get_lawn_health():
-            """API endpoint for getting lawn health information"""
-            if self.services.get('health_analyzer'):
-                health = self.services['health_analyzer'].get_lawn_health()
-                return jsonify({'success': True, 'health': health})
+        # Save configuration
+        self.config.save()
             
-            # Return dummy lawn health data if analyzer not available
-            return jsonify({
-                'success': True,
-                'health': {
-                    'overall': 85,
-                    'zones': {
-                        1: 90,
-                        2: 75,
-                        3: 85,
-                        4: 88
-                    },
-                    'recommendations': [
-                        'Increase watering in zone 2',
-                        'Consider fertilizing in the next week',
-                        'Adjust cutting height to 5cm for better growth'
-                    ]
-                }
-            })
-        
-        @self.app.route('/api/v1/weather', methods=['GET'])
-        @login_required
-        def api_get_weather():
-            """API endpoint for getting weather information"""
-            if self.services.get('weather_scheduler'):
-                weather = self.services['weather_scheduler'].get_weather()
-                return jsonify({'success': True, 'weather': weather})
+        return _json({'success': True})
+    
+    def api_get_maintenance(self):
+        """API endpoint for getting maintenance information"""
+        if self.maintenance_tracker:
+            maintenance = self.maintenance_tracker.get_maintenance_info()
+            return _json({'success': True, 'maintenance': maintenance})
             
-            # Return dummy weather data if scheduler not available
-            return jsonify({
-                'success': True,
-                'weather': {
-                    'current': {
-                        'condition': 'clear',
-                        'temperature': 22,
-                        'humidity': 65,
-                        'wind_speed': 3,
-                        'rain_probability': 0
-                    },
-                    'forecast': [
-                        {
-                            'day': 'Today',
-                            'condition': 'clear',
-                            'temperature_high': 25,
-                            'temperature_low': 18,
-                            'rain_probability': 0
-                        },
-                        {
-                            'day': 'Tomorrow',
-                            'condition': 'cloudy',
-                            'temperature_high': 23,
-                            'temperature_low': 17,
-                            'rain_probability': 30
-                        },
-                        {
-                            'day': 'Day 3',
-                            'condition': 'rain',
-                            'temperature_high': 20,
-                            'temperature_low': 15,
-                            'rain_probability': 80
-                        }
-                    ]
-                }
-            })
-        
-        @self.app.route('/api/v1/activity', methods=['GET'])
-        @login_required
-        def api_get_activity():
-            """API endpoint for getting recent activity"""
-            # Return dummy activity data
-            return jsonify({
-                'success': True,
-                'activity': [
-                    {
-                        'id': 1,
-                        'timestamp': '2025-03-09T21:00:00Z',
-                        'type': 'mowing_completed',
-                        'description': 'Front yard mowing completed successfully. 98% coverage achieved.',
-                        'zone_id': 1
-                    },
-                    {
-                        'id': 2,
-                        'timestamp': '2025-03-09T19:00:00Z',
-                        'type': 'obstacle_detected',
-                        'description': 'Temporary obstacle detected and avoided in the east section.',
-                        'zone_id': 1
-                    },
-                    {
-                        'id': 3,
-                        'timestamp': '2025-03-08T15:30:00Z',
-                        'type': 'battery_charged',
-                        'description': 'Battery charged to 100%. Charging time: 3h 25m.'
-                    },
-                    {
-                        'id': 4,
-                        'timestamp': '2025-03-07T12:00:00Z',
-                        'type': 'system_update',
-                        'description': 'System updated to version 2.1.4. New features added.'
-                    }
-                ]
-            })
-        
-        @self.app.route('/api/v1/mower/manual-control', methods=['POST'])
-        @login_required
-        def api_manual_control():
-            """API endpoint for manual control of the mower"""
-            if not self.mower_controller:
-                return jsonify({'success': False, 'error': 'Mower controller not available'})
+        # Return dummy maintenance data if tracker not available
+        return _json_bytes(_DUMMY_MAINTENANCE_RESPONSE)
+    
+    def api_record_maintenance(self, item_id):
+        """API endpoint for recording maintenance"""
+        if not self.maintenance_tracker:
+            return _json({'success': False, 'error': 'Maintenance tracker not available'})
             
-            control_data = request.json
-            if not control_data:
-                return jsonify({'success': False, 'error': 'No data provided'})
+        success = self.maintenance_tracker.record_maintenance(item_id)
+        return _json({'success': success})
+    
+    def api_get_lawn_health(self):
+        """API endpoint for getting lawn health information"""
+        if self.health_analyzer:
+            health = self.health_analyzer.get_lawn_health()
+            return _json({'success': True, 'health': health})
             
-            command = control_data.get('command')
-            speed = control_data.get('speed', 0.5)
-            duration = control_data.get('duration', 1.0)
+        # Return dummy lawn health data if analyzer not available
+        return _json_bytes(_DUMMY_LAWN_HEALTH_RESPONSE)
+    
+    def api_get_weather(self):
+        """API endpoint for getting weather information"""
+        if self.weather_scheduler:
+            weather = self.weather_scheduler.get_weather()
+            return _json({'success': True, 'weather': weather})
             
-            try:
-                success = self.mower_controller.manual_control(command, speed, duration)
-                return jsonify({'success': success})
-            except Exception as e:
-                return jsonify({'success': False, 'error': str(e)})
-        
-        @self.app.route('/api/v1/logs', methods=['GET'])
-        @login_required
-        def api_get_logs():
-            """API endpoint for getting system logs"""
-            if not current_user.is_admin():
-                return jsonify({'success': False, 'error': 'Admin privileges required'})
+        # Return dummy weather data if scheduler not available
+        return _json_bytes(_DUMMY_WEATHER_RESPONSE)
+    
+    def api_get_activity(self):
+        """API endpoint for getting recent activity"""
+        # Return dummy activity data
+        return _json_bytes(_DUMMY_ACTIVITY_RESPONSE)
+    
+    def api_manual_control(self):
+        """API endpoint for manual control of the mower"""
+        if not self.mower_controller:
+            return _json({'success': False, 'error': 'Mower controller not available'})
             
-            lines = request.args.get('lines', 100, type=int)
-            level = request.args.get('level', 'INFO')
+        control_data = request.get_json(silent=True)
+        if not control_data:
+            return _json({'success': False, 'error': 'No data provided'})
             
-            # Return dummy log data
-            return jsonify({
-                'success': True,
-                'logs': [
-                    {
-                        'timestamp': '2025-03-09T23:45:12Z',
-                        'level': 'INFO',
-                        'module': 'main',
-                        'message': 'System started successfully'
-                    },
-                    {
-                        'timestamp': '2025-03-09T23:45:15Z',
-                        'level': 'INFO',
-                        'module': 'navigation',
-                        'message': 'GPS position acquired: 47.6062, -122.3321'
-                    },
-                    {
-                        'timestamp': '2025-03-09T23:46:01Z',
-                        'level': 'WARNING',
-                        'module': 'mower',
-                        'message': 'Battery level below 30%, consider charging soon'
-                    },
-                    {
-                        'timestamp': '2025-03-09T23:47:30Z',
-                        'level': 'INFO',
-                        'module': 'theft_protection',
-                        'message': 'Perimeter check complete, no intrusions detected'
-                    }
-                ]
-            })
-        
-        @self.app.route('/api/v1/perception/obstacles', methods=['GET'])
-        @login_required
-        def api_get_obstacles():
-            """API endpoint for getting current obstacle detections"""
-            return jsonify({
-                'success': True,
-                'obstacles': [
-                    {
-                        'id': 1,
-                        'timestamp': '2025-03-10T00:10:15Z',
-                        'class': 'person',
-                        'confidence': 0.95,
-                        'distance': 4.2,
-                        'position': {
-                            'x': 2.3,
-                            'y': 1.5
-                        },
-                        'size': {
-                            'width': 0.5,
-                            'height': 1.7
-                        },
-                        'is_safety_critical': True
-                    },
-                    {
-                        'id': 2,
-                        'timestamp': '2025-03-10T00:10:15Z',
-                        'class': 'dog',
-                        'confidence': 0.87,
-                        'distance': 6.1,
-                        'position': {
-                            'x': -1.2,
-                            'y': 2.3
-                        },
-                        'size': {
-                            'width': 0.4,
-                            'height': 0.5
-                        },
-                        'is_safety_critical': True
-                    }
-                ]
-            })
+        command = control_data.get('command')
+        speed = control_data.get('speed', 0.5)
+        duration = control_data.get('duration', 1.0)
+            
+        success = self.mower_controller.manual_control(command, speed, duration)
+        return _json({'success': success})
+    
+    def api_get_logs(self):
+        """API endpoint for getting system logs"""
+        if not current_user.is_admin():
+            return _json({'success': False, 'error': 'Admin privileges required'})
+            
+        lines = request.args.get('lines', 100, type=int)
+        level = request.args.get('level', 'INFO')
+        min_level = logging.getLevelName(level.upper())
+        if not isinstance(min_level, int):
+            min_level = logging.INFO
+            
+        # The stream is only read when the client copy is out of date, the ETag
+        # follows the log file instead of the body
+        query = f"{lines}:{min_level}"
+        if self.log_file and os.path.exists(self.log_file):
+            stat = os.stat(self.log_file)
+            return _conditional(_json_list_stream('logs', self._read_log(self.log_file, lines, min_level)),
+                                _etag(f"{query}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')))
+            
+        # Return dummy log data, which only changes with the query
+        return _conditional(_json_list_stream('logs', (entry for entry in _DUMMY_LOGS
+                                                      if logging.getLevelName(entry['level']) >= min_level)),
+                            _etag(f"{query}:dummy".encode('utf-8')))
+    
+    @staticmethod
+    def _read_log(log_file: str, lines: int, min_level: int):
+        """
+        Read the last lines of the system log file.
+        
+        Args:
+            log_file: Path of the log file
+            lines: Number of lines to read from the end of the file
+            min_level: Lowest logging level to return
+            
+        Yields:
+            Log entries with timestamp, level, module and message
+        """
+        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+            tail = deque(f, maxlen=max(lines, 0))
+        
+        for line in tail:
+            # Lines are written as '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            parts = line.rstrip('\n').split(' - ', 3)
+            if len(parts) != 4:
+                continue
+            levelno = logging.getLevelName(parts[2])
+            if not isinstance(levelno, int) or levelno < min_level:
+                continue
+            yield {
+                'timestamp': parts[0],
+                'level': parts[2],
+                'module': parts[1],
+                'message': parts[3]
+            }
+    
+    def api_get_obstacles(self):
+        """API endpoint for getting current obstacle detections"""
+        return _conditional(_json_bytes(_DUMMY_OBSTACLES_RESPONSE), _DUMMY_OBSTACLES_ETAG)
     
     def _setup_socketio_events(self):
         """Set up Socket.IO event handlers"""
@@ -863,45 +1559,45 @@ class WebInterface:
         @self.socketio.on('get_status')
         def handle_get_status():
             """Handle status request"""
-            emit('status', self._get_status())
-        
-        @self.socketio.on('start_mower')
-        def handle_start_mower(data):
-            """Handle mower start request"""
-            zone_id = data.get('zone_id') if data else None
+            emit('status', self._current_status())
+        
+        def run_mower_command(data=None):
+            """Run a mower command request, see MOWER_ACTIONS"""
+            if data is None:
+                data = {}
+            if not isinstance(data, dict):
+                emit('mower_command_result', {'command': None, 'success': False, 'error': 'Invalid command data'})
+                return
             
-            if self.mower_controller:
-                success = self.mower_controller.start(zone_id=zone_id)
-                emit('mower_command_result', {'command': 'start', 'success': success})
-            else:
-                emit('mower_command_result', {'command': 'start', 'success': False, 'error': 'Mower controller not available'})
-        
-        @self.socketio.on('stop_mower')
-        def handle_stop_mower():
-            """Handle mower stop request"""
-            if self.mower_controller:
-                success = self.mower_controller.stop()
-                emit('mower_command_result', {'command': 'stop', 'success': success})
-            else:
-                emit('mower_command_result', {'command': 'stop', 'success': False, 'error': 'Mower controller not available'})
-        
-        @self.socketio.on('pause_mower')
-        def handle_pause_mower():
-            """Handle mower pause request"""
-            if self.mower_controller:
-                success = self.mower_controller.pause()
-                emit('mower_command_result', {'command': 'pause', 'success': success})
-            else:
-                emit('mower_command_result', {'command': 'pause', 'success': False, 'error': 'Mower controller not available'})
-        
-        @self.socketio.on('dock_mower')
-        def handle_dock_mower():
-            """Handle mower return to dock request"""
-            if self.mower_controller:
-                success = self.mower_controller.return_to_dock()
-                emit('mower_command_result', {'command': 'dock', 'success': success})
-            else:
-                emit('mower_command_result', {'command': 'dock', 'success': False, 'error': 'Mower controller not available'})
+            command = data.get('command')
+            action = MOWER_ACTIONS.get(command)
+            if action is None:
+                emit('mower_command_result', {'command': command, 'success': False, 'error': 'Unknown command'})
+                return
+            
+            mower_controller = self.mower_controller
+            if mower_controller is None:
+                emit('mower_command_result', {'command': command, 'success': False, 'error': 'Mower controller not available'})
+                return
+            
+            method, takes_zone = action
+            kwargs = {'zone_id': data.get('zone_id')} if takes_zone else {}
+            success = getattr(mower_controller, method)(**kwargs)
+            emit('mower_command_result', {'command': command, 'success': success})
+        
+        self.socketio.on_event('mower_command', run_mower_command)
+        
+        # Deprecated per-command events, kept for one release for older clients
+        def legacy_command_handler(command: str):
+            """Create the handler for a deprecated <command>_mower event"""
+            def handler(data=None):
+                payload = dict(data) if isinstance(data, dict) else {}
+                payload['command'] = command
+                run_mower_command(payload)
+            return handler
+        
+        for command in MOWER_ACTIONS:
+            self.socketio.on_event(f'{command}_mower', legacy_command_handler(command))
     
     def _get_status(self) -> Dict[str, Any]:
         """
@@ -910,149 +1606,196 @@ class WebInterface:
         Returns:
             Dictionary with system status information
         """
-        # Get status from services
-        status = {
-            'timestamp': datetime.datetime.utcnow().isoformat() + 'Z',
-            'mower': self._get_mower_status(),
-            'power': self._get_power_status(),
-            'navigation': self._get_navigation_status(),
-            'zone': self._get_zone_status(),
-            'schedule': self._get_schedule_status(),
-            'maintenance': self._get_maintenance_status(),
-            'weather': self._get_weather_status(),
-            'system': self._get_system_status()
-        }
+        status = {'timestamp': _now_iso()}
+        
+        # Query the services concurrently. A service that does not answer within the
+        # timeout keeps its last good status and is not queried again until the
+        # outstanding call returns, so a hung service cannot use up the pool.
+        futures = {}
+        for section, getter in (('mower', self._get_mower_status),
+                                ('power', self._get_power_status),
+                                ('navigation', self._get_navigation_status),
+                                ('zone', self._get_zone_status),
+                                ('schedule', self._get_schedule_status),
+                                ('maintenance', self._get_maintenance_status),
+                                ('weather', self._get_weather_status)):
+            with self._status_lock:
+                future = self._status_pending.get(section)
+                if future is None or future.done():
+                    future = self._status_pool.submit(getter)
+                    self._status_pending[section] = future
+            futures[section] = future
+        done, _ = wait(futures.values(), timeout=self.status_timeout)
+        
+        last_good = self._last_good_status
+        for section, future in futures.items():
+            if future not in done:
+                logger.warning(f"Timed out getting {section} status")
+            elif future.exception():
+                logger.error(f"Error getting {section} status: {future.exception()}")
+            else:
+                last_good[section] = future.result()
+            
+            # Sections that never answered are marked instead of left out
+            status[section] = last_good.get(section, _UNAVAILABLE_STATUS)
+        
+        status['system'] = self._get_system_status()
+        
+        return status
+    
+    def _current_status(self) -> Dict[str, Any]:
+        """
+        Get the status most recently collected by the status update loop.
+        
+        Requests are answered without waiting for the services. The status is only
+        collected here while the loop has not produced one yet.
         
+        Returns:
+            Dictionary with system status information
+        """
+        status = self._latest_status
+        if status is None or not self.running:
+            status = self._get_status()
         return status
     
     def _get_mower_status(self) -> Dict[str, Any]:
         """Get mower status"""
-        if self.mower_controller:
-            return self.mower_controller.get_status()
+        mower_controller = self.mower_controller
+        if mower_controller is not None:
+            return mower_controller.get_status()
         
         # Return dummy data if mower controller not available
-        return {
-            'state': 'idle',
-            'progress': 0,
-            'runtime': 0,
-            'blade_rpm': 0,
-            'error': None
-        }
+        return _DUMMY_MOWER_STATUS
     
     def _get_power_status(self) -> Dict[str, Any]:
         """Get power status"""
-        if self.services.get('power_manager'):
-            return self.services['power_manager'].get_status()
+        power_manager = self.power_manager
+        if power_manager is not None:
+            return power_manager.get_status()
         
         # Return dummy data if power manager not available
-        return {
-            'battery_level': 85,
-            'charging': False,
-            'voltage': 24.5,
-            'current': 1.2,
-            'temperature': 28
-        }
+        return _DUMMY_POWER_STATUS
     
     def _get_navigation_status(self) -> Dict[str, Any]:
         """Get navigation status"""
-        if self.navigation_manager:
-            return self.navigation_manager.get_status()
+        navigation_manager = self.navigation_manager
+        if navigation_manager is not None:
+            return navigation_manager.get_status()
         
         # Return dummy data if navigation manager not available
-        return {
-            'position': {'x': 12.5, 'y': 8.3},
-            'orientation': 45.0,
-            'speed': 0.0,
-            'gps_quality': 'good',
-            'satellites': 8
-        }
+        return _DUMMY_NAVIGATION_STATUS
     
     def _get_zone_status(self) -> Dict[str, Any]:
         """Get zone status"""
-        if self.zone_manager:
-            return self.zone_manager.get_status()
+        zone_manager = self.zone_manager
+        if zone_manager is not None:
+            return zone_manager.get_status()
         
         # Return dummy data if zone manager not available
-        return {
-            'current_zone': 'Front Yard',
-            'current_zone_id': 1,
-            'zone_count': 4,
-            'active_zones': 3,
-            'total_area': 250
-        }
+        return _DUMMY_ZONE_STATUS
     
     def _get_schedule_status(self) -> Dict[str, Any]:
         """Get schedule status"""
-        if self.scheduler:
-            return self.scheduler.get_status()
+        scheduler = self.scheduler
+        if scheduler is not None:
+            return scheduler.get_status()
         
         # Return dummy data if scheduler not available
-        return {
-            'enabled': True,
-            'next_mowing': 'Tomorrow 10:00',
-            'next_zone_id': 1,
-            'rain_delay_active': False
-        }
+        return _DUMMY_SCHEDULE_STATUS
     
     def _get_maintenance_status(self) -> Dict[str, Any]:
         """Get maintenance status"""
-        if self.services.get('maintenance_tracker'):
-            return self.services['maintenance_tracker'].get_status()
+        maintenance_tracker = self.maintenance_tracker
+        if maintenance_tracker is not None:
+            return maintenance_tracker.get_status()
         
         # Return dummy data if maintenance tracker not available
-        return {
-            'blade_wear': 15,
-            'total_mowing_hours': 45,
-            'maintenance_due': 'Filter cleaning in 2 hours'
-        }
+        return _DUMMY_MAINTENANCE_STATUS
     
     def _get_weather_status(self) -> Dict[str, Any]:
         """Get weather status"""
-        if self.services.get('weather_scheduler'):
-            return self.services['weather_scheduler'].get_status()
+        weather_scheduler = self.weather_scheduler
+        if weather_scheduler is not None:
+            return weather_scheduler.get_status()
         
         # Return dummy data if weather scheduler not available
-        return {
-            'condition': 'clear',
-            'temperature': 22,
-            'humidity': 65,
-            'wind_speed': 3,
-            'rain_probability': 0,
-            'rain_expected_24h': False
-        }
+        return _DUMMY_WEATHER_STATUS
     
     def _get_system_status(self) -> Dict[str, Any]:
         """Get system status"""
         # Get system stats
-        return {
-            'cpu_usage': 25,
-            'memory_usage': 45,
-            'disk_usage': 30,
-            'temperature': 40,
-            'uptime': '2d 7h 35m'
-        }
+        return _DUMMY_SYSTEM_STATUS
     
     def start_status_updates(self) -> None:
-        """Start status update thread"""
+        """Start status update task"""
         if self.running:
             logger.warning("Status updates already running")
             return
         
         self.running = True
-        self.status_thread = threading.Thread(target=self._status_update_loop)
-        self.status_thread.daemon = True
-        self.status_thread.start()
+        self._last_status_bytes = {}
+        # A Socket.IO background task stays on the server's event loop under eventlet/gevent
+        self.status_thread = self.socketio.start_background_task(self._status_update_loop)
         
-        logger.info("Status update thread started")
+        logger.info("Status update task started")
     
     def stop_status_updates(self) -> None:
-        """Stop status update thread"""
+        """Stop status update task"""
         self.running = False
         
-        if self.status_thread and self.status_thread.is_alive():
-            self.status_thread.join(timeout=2.0)
+        if self.status_thread:
+            self.status_thread.join()
+            self.status_thread = None
         
-        logger.info("Status update thread stopped")
+        # Hand over status broadcasting to another worker right away
+        if self._leader_redis and self._is_leader:
+            try:
+                if self._leader_redis.get(STATUS_LEADER_KEY) == self._leader_id:
+                    self._leader_redis.delete(STATUS_LEADER_KEY)
+            except redis.RedisError as e:
+                logger.warning(f"Could not release status leadership: {e}")
+            self._is_leader = False
+        
+        # Drop queued getters and let the pool threads exit. A fresh pool starts no
+        # threads until requests query the status again.
+        pool = self._status_pool
+        self._status_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='status')
+        with self._status_lock:
+            self._status_pending.clear()
+        pool.shutdown(wait=False, cancel_futures=True)
+        
+        logger.info("Status update task stopped")
+    
+    def _is_status_leader(self) -> bool:
+        """
+        Check whether this worker produces the status broadcast.
+        
+        Workers sharing a Redis message queue elect one leader through a key set with
+        NX and a TTL of a few update intervals. The leader renews it on every update,
+        another worker takes over when it expires.
+        
+        Returns:
+            True if this worker should build and broadcast the status
+        """
+        if not self._leader_redis:
+            return True
+        
+        ttl_ms = int(self.status_interval * 3000)
+        try:
+            leader = (self._leader_redis.set(STATUS_LEADER_KEY, self._leader_id, nx=True, px=ttl_ms) or
+                      self._leader_redis.get(STATUS_LEADER_KEY) == self._leader_id)
+            if leader:
+                self._leader_redis.pexpire(STATUS_LEADER_KEY, ttl_ms)
+        except redis.RedisError as e:
+            # Rather broadcast twice than not at all
+            logger.warning(f"Status leader election failed: {e}")
+            leader = True
+        
+        if leader and not self._is_leader:
+            # Another worker broadcast before, start over with the full status
+            self._last_status_bytes = {}
+        self._is_leader = bool(leader)
+        return self._is_leader
     
     def _status_update_loop(self) -> None:
         """Status update loop"""
@@ -1060,22 +1803,65 @@ class WebInterface:
         
         while self.running:
             try:
-                # Get status
+                # Every worker refreshes the status its requests are served from,
+                # only the leader broadcasts it
                 status = self._get_status()
+                self._latest_status = status
                 
-                # Emit status update to all connected clients
-                self.socketio.emit('status', status)
+                if not self._is_status_leader():
+                    self.socketio.sleep(self.status_interval)
+                    continue
                 
-                # Sleep a bit
-                time.sleep(1.0)
+                # Only broadcast the sections that changed, clients request the full
+                # status when they connect
+                delta = {}
+                for section, value in status.items():
+                    if section == 'timestamp':
+                        continue
+                    encoded = orjson.dumps(value, option=ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+                    if self._last_status_bytes.get(section) != encoded:
+                        self._last_status_bytes[section] = encoded
+                        delta[section] = value
                 
+                if delta:
+                    delta['timestamp'] = status['timestamp']
+                    self.socketio.emit('status_delta', delta)
             except Exception as e:
                 logger.error(f"Error in status update loop: {e}")
-                time.sleep(5.0)
+            
+            # Yield to the event loop until the next update, also after errors so
+            # a transient failure doesn't hold back the dashboard
+            self.socketio.sleep(self.status_interval)
+    
+    def _raise_fd_limit(self) -> None:
+        """Raise the open file limit towards web.max_open_files"""
+        if not RESOURCE_AVAILABLE:
+            return
+        
+        try:
+            soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+            target = self.max_open_files
+            if hard != resource.RLIM_INFINITY and hard < target:
+                logger.warning(f"Open file hard limit {hard} is below web.max_open_files ({target}), "
+                               f"connections beyond it will be refused")
+                target = hard
+            if soft != resource.RLIM_INFINITY and soft < target:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+                logger.info(f"Raised open file limit from {soft} to {target}")
+        except (ValueError, OSError) as e:
+            logger.warning(f"Could not raise open file limit: {e}")
     
     def run(self) -> None:
         """Run the web server"""
-        logger.info(f"Starting web server on {self.host}:{self.port}")
+        logger.info(f"Starting web server on {self.host}:{self.port} ({self.socketio.async_mode})")
+        
+        # Each client holds a socket, allow more than the usual 1024
+        self._raise_fd_limit()
+        
+        # The Werkzeug development server is only used for debugging
+        if not self.debug and GUNICORN_AVAILABLE and self.socketio.async_mode in GUNICORN_WORKERS:
+            self.run_production()
+            return
         
         # Start status updates
         self.start_status_updates()
@@ -1106,10 +1892,80 @@ class WebInterface:
         finally:
             # Stop status updates
             self.stop_status_updates()
+    
+    def run_production(self) -> None:
+        """
+        Run the web server under gunicorn.
+        
+        The application is preloaded in the master process and each worker starts its
+        own status updates. Socket.IO needs sticky sessions and a message queue to run
+        with more than one worker, so additional workers are only useful behind a
+        load balancer that provides them.
+        """
+        web_interface = self
+        
+        options = {
+            'bind': f"{self.host}:{self.port}",
+            'worker_class': GUNICORN_WORKERS[self.socketio.async_mode],
+            'workers': self.workers,
+            'worker_connections': self.worker_connections,
+            'keepalive': 5,
+            'backlog': self.listen_backlog,
+            'preload_app': True,
+            'post_worker_init': lambda worker: web_interface.start_status_updates(),
+            'worker_exit': lambda server, worker: web_interface.stop_status_updates()
+        }
+        if self.socketio.async_mode == 'threading':
+            options['threads'] = self.worker_threads
+        if self.enable_ssl:
+            options['certfile'] = self.cert_file
+            options['keyfile'] = self.key_file
+        
+        if self.workers > 1:
+            logger.warning("Running several web workers, clients need sticky sessions")
+        
+        from gunicorn.app.base import BaseApplication
+        
+        class _Application(BaseApplication):
+            def load_config(self):
+                for key, value in options.items():
+                    self.cfg.set(key, value)
+            
+            def load(self):
+                return web_interface.app
+        
+        logger.info(f"Starting gunicorn with {self.workers} {options['worker_class']} worker(s)")
+        _Application().run()
+
+
+def create_app():
+    """
+    Create the Flask application for an external WSGI server.
+    
+    Nothing is started in the background here. Status updates are started in each
+    worker by the hooks in web/gunicorn_conf.py, for example:
+    
+        gunicorn -c web/gunicorn_conf.py -k eventlet -w 4 "web.server:create_app()"
+    
+    With several workers, set web.message_queue so clients are shared between them
+    and a single worker broadcasts the status.
+    
+    Returns:
+        Flask application, with the WebInterface in app.extensions['web_interface']
+    """
+    config = ConfigManager("config/local_config.yaml", "config/default_config.yaml")
+    web_interface = WebInterface(config)
+    web_interface.app.extensions['web_interface'] = web_interface
+    return web_interface.app
 
 
 def main():
-    """Run the web server as a standalone application"""
+    """
+    Run the web server as a standalone application.
+    
+    Start it with python -m web, which patches the process for eventlet before this
+    module is imported.
+    """
     # Set up logging
     setup_logger(level=logging.INFO)
     